@@ -2,6 +2,9 @@
 V2T 2.1 - Audio Recorder
 Handles microphone capture using sounddevice.
 """
+import io
+import math
+import os
 import threading
 import queue
 import tempfile
@@ -16,12 +19,37 @@ import sounddevice as sd
 from src.utils.constants import AudioConfig, DATA_DIR
 
 
+def _sounddevice_version() -> tuple:
+    """Installed sounddevice version as (major, minor), (0, 0) if unknown."""
+    parts = getattr(sd, "__version__", "0.0").split(".")
+    try:
+        return int(parts[0]), int(parts[1])
+    except (IndexError, ValueError):
+        return 0, 0
+
+
+# Releases whose private _terminate/_initialize pair is known to rescan devices
+_CAN_REINIT_PORTAUDIO = (
+    (0, 3) <= _sounddevice_version() < (0, 6)
+    and hasattr(sd, "_terminate")
+    and hasattr(sd, "_initialize")
+)
+
+
 class AudioRecorder:
     """
     Real-time audio recorder using sounddevice.
     Captures audio and provides level data for visualization.
     """
     
+    # Input device list cache, shared by all instances
+    _devices_cache: Optional[List[dict]] = None
+    _devices_cache_time = 0.0
+    _devices_lock = threading.Lock()
+    # Streams currently open (rescan is unsafe while > 0). Only AudioRecorder
+    # opens sounddevice streams in this app, so the count is complete.
+    _open_streams = 0
+    
     def __init__(self, device_index: Optional[int] = None):
         """
         Initialize the audio recorder.
@@ -35,9 +63,18 @@ class AudioRecorder:
         self.chunk_size = AudioConfig.CHUNK_SIZE
         
         self._stream: Optional[sd.InputStream] = None
-        self._frames: List[np.ndarray] = []
+        self._reader_thread: Optional[threading.Thread] = None
         self._is_recording = False
-        self._lock = threading.Lock()
+        
+        # Recording buffer: grows by doubling, filled in place by the reader thread
+        self._buffer: Optional[np.ndarray] = None
+        self._buffer_len = 0  # Number of frames written
+        self._max_frames = self.sample_rate * AudioConfig.MAX_RECORD_SECONDS
+        self._ring_pos = 0  # Oldest frame once the buffer wraps
+        self._truncated = False
+        self._peak_rms = 0.0  # Loudest block of the current recording
+        # No lock: the reader thread is the only writer, and start()/stop()
+        # only touch the buffer while that thread is not running
         
         # Callback for real-time audio data (for waveform visualization)
         self._on_audio_data: Optional[Callable[[np.ndarray], None]] = None
@@ -45,34 +82,76 @@ class AudioRecorder:
         
         # Silence detection
         self._last_sound_time = 0.0
-        self._silence_threshold_amp = 0.02  # Amplitude threshold (0.0 - 1.0)
         self._silence_limit = 3.0  # Seconds before stopping
+        # Decaying peak of recent input (0.0 - 1.0); the silence threshold
+        # follows it so loud and quiet microphones both work
+        self._peak_amp = 0.0
+        self._peak_decay = 0.5 ** (
+            self.chunk_size / self.sample_rate / AudioConfig.SILENCE_PEAK_HALF_LIFE
+        )
         
         # Queue for audio chunks (thread-safe)
         self._audio_queue: queue.Queue = queue.Queue()
     
-    @staticmethod
-    def get_devices() -> List[dict]:
+    @classmethod
+    def get_devices(cls, refresh: bool = False) -> List[dict]:
         """
         Get list of available input devices.
+        Enumerating host APIs is slow, so the list is cached for
+        AudioConfig.DEVICE_CACHE_SECONDS.
+        
+        Args:
+            refresh: Rescan devices (picks up newly plugged microphones)
         
         Returns:
             List of dicts with 'index' and 'name' keys
         """
-        devices = []
+        with cls._devices_lock:
+            now = time.monotonic()
+            if (
+                not refresh
+                and cls._devices_cache is not None
+                and now - cls._devices_cache_time < AudioConfig.DEVICE_CACHE_SECONDS
+            ):
+                return list(cls._devices_cache)
+            
+            if refresh and cls._open_streams == 0:
+                cls._reinit_portaudio()
+            
+            devices = []
+            try:
+                device_list = sd.query_devices()
+                for i, device in enumerate(device_list):
+                    if device.get("max_input_channels", 0) > 0:
+                        devices.append({
+                            "index": i,
+                            "name": device.get("name", f"Device {i}"),
+                            "channels": device.get("max_input_channels", 1),
+                            "sample_rate": device.get("default_samplerate", 44100)
+                        })
+            except Exception as e:
+                print(f"[AudioRecorder] Error getting devices: {e}")
+                return devices
+            
+            cls._devices_cache = devices
+            cls._devices_cache_time = now
+            return list(devices)
+    
+    @staticmethod
+    def _reinit_portaudio() -> None:
+        """
+        Restart PortAudio, which only enumerates devices on initialization.
+        sounddevice has no public call for this, so the private pair is
+        only used on releases known to have it; elsewhere the refresh falls
+        back to querying the current list.
+        """
+        if not _CAN_REINIT_PORTAUDIO:
+            return
         try:
-            device_list = sd.query_devices()
-            for i, device in enumerate(device_list):
-                if device.get("max_input_channels", 0) > 0:
-                    devices.append({
-                        "index": i,
-                        "name": device.get("name", f"Device {i}"),
-                        "channels": device.get("max_input_channels", 1),
-                        "sample_rate": device.get("default_samplerate", 44100)
-                    })
+            sd._terminate()
+            sd._initialize()
         except Exception as e:
-            print(f"[AudioRecorder] Error getting devices: {e}")
-        return devices
+            print(f"[AudioRecorder] Error rescanning devices: {e}")
     
     @staticmethod
     def get_default_device() -> Optional[int]:
@@ -84,6 +163,9 @@ class AudioRecorder:
     
     def set_device(self, device_index: Optional[int]) -> None:
         """Set the input device to use."""
+        if device_index != self.device_index and not self._is_recording:
+            # The idle stream is bound to the previous device
+            self._close_stream()
         self.device_index = device_index
     
     def set_audio_callback(self, callback: Callable[[np.ndarray], None]) -> None:
@@ -93,39 +175,132 @@ class AudioRecorder:
         """
         self._on_audio_data = callback
         
-    def set_silence_callback(self, callback: Callable[[], None]) -> None:
-        """Set callback for silence detected."""
+    def set_silence_callback(self, callback: Optional[Callable[[], None]]) -> None:
+        """Set callback for silence detected (None disables detection)."""
         self._on_silence_detected = callback
         
     def update_silence_threshold(self, limit_seconds: float) -> None:
         """Update silence limit in seconds."""
         self._silence_limit = limit_seconds
     
-    def _audio_callback(
-        self, 
-        indata: np.ndarray, 
-        frames: int, 
-        time_info, 
-        status
-    ) -> None:
-        """Internal callback for sounddevice stream."""
-        if status:
-            print(f"[AudioRecorder] Stream status: {status}")
-        
-        # Copy data
-        audio_chunk = indata.copy()
-        
-        with self._lock:
-            if self._is_recording:
-                self._frames.append(audio_chunk)
+    def _read_loop(self) -> None:
+        """
+        Pull blocks from the stream until recording stops (reader thread).
+        Blocking reads keep Python off PortAudio's realtime thread; the
+        driver buffers audio while this thread waits for the GIL.
+        """
+        while self._is_recording:
+            try:
+                indata, overflowed = self._stream.read(self.chunk_size)
+            except Exception as e:
+                print(f"[AudioRecorder] Error reading stream: {e}")
+                break
+            
+            if overflowed:
+                print("[AudioRecorder] Stream status: input overflow")
+            self._handle_block(indata)
+    
+    def _handle_block(self, indata: np.ndarray) -> None:
+        """Store one block and forward it to the visualization callback."""
+        audio_chunk = self._append_frames(indata)
+        samples = audio_chunk.ravel()
+        
+        block_rms = self._int16_rms(samples)
+        if block_rms > self._peak_rms:
+            self._peak_rms = block_rms
+        
+        if self._on_silence_detected:
+            self._check_silence(samples)
         
         # Send to visualization callback
         if self._on_audio_data:
             try:
-                self._on_audio_data(audio_chunk.flatten())
+                self._on_audio_data(samples)
+            except Exception:
+                pass
+    
+    def _check_silence(self, samples: np.ndarray) -> None:
+        """
+        Fire the silence callback once the input stayed quiet long enough.
+        Levels come from one sample per millisecond: a silence decision
+        does not need every sample, and the strided view is not copied.
+        """
+        now = time.time()
+        sub = samples[::max(1, self.sample_rate // 1000)]
+        
+        block_peak = max(int(sub.max()), -int(sub.min())) / 32767
+        self._peak_amp = max(block_peak, self._peak_amp * self._peak_decay)
+        
+        # Halfway (in dB) between the recent peak and -60 dBFS
+        threshold = max(math.sqrt(self._peak_amp * 1e-3), AudioConfig.SILENCE_FLOOR_AMP)
+        
+        if self._int16_rms(sub) / 32767 > threshold:
+            self._last_sound_time = now
+        elif now - self._last_sound_time >= self._silence_limit:
+            self._last_sound_time = now  # Fire once per silent stretch
+            try:
+                self._on_silence_detected()
             except Exception:
                 pass
     
+    def _append_frames(self, indata: np.ndarray) -> np.ndarray:
+        """
+        Copy a block into the recording buffer (reader thread only).
+        
+        Returns:
+            View of the buffer region that was written
+        """
+        start = self._buffer_len
+        end = start + len(indata)
+        
+        if self._truncated or end > self._max_frames:
+            return self._append_ring(indata)
+        
+        if end > len(self._buffer):
+            # Grow geometrically so long recordings reallocate O(log n) times
+            grown = np.empty(
+                (min(max(end, 2 * len(self._buffer)), self._max_frames), self.channels),
+                dtype=np.int16
+            )
+            grown[:start] = self._buffer[:start]
+            self._buffer = grown
+        
+        self._buffer[start:end] = indata
+        self._buffer_len = end
+        return self._buffer[start:end]
+    
+    def _append_ring(self, indata: np.ndarray) -> np.ndarray:
+        """
+        Write a block once the recording limit is reached, overwriting
+        the oldest frames (reader thread only).
+        """
+        if len(self._buffer) != self._max_frames:
+            grown = np.empty((self._max_frames, self.channels), dtype=np.int16)
+            grown[:self._buffer_len] = self._buffer[:self._buffer_len]
+            self._buffer = grown
+        
+        if not self._truncated:
+            # Fill the tail first, then start wrapping
+            self._ring_pos = self._buffer_len
+            self._buffer_len = self._max_frames
+            self._truncated = True
+        
+        indata = indata[-self._max_frames:]
+        start = self._ring_pos
+        end = start + len(indata)
+        
+        if end <= self._max_frames:
+            self._buffer[start:end] = indata
+            written = self._buffer[start:end]
+        else:
+            split = self._max_frames - start
+            self._buffer[start:] = indata[:split]
+            self._buffer[:end - self._max_frames] = indata[split:]
+            written = indata  # stream.read() returns a fresh array per block
+        
+        self._ring_pos = end % self._max_frames
+        return written
+    
     def start(self) -> bool:
         """
         Start recording audio.
@@ -137,25 +312,42 @@ class AudioRecorder:
             return True
         
         try:
-            with self._lock:
-                self._frames = []
-                self._is_recording = True
-                self._last_sound_time = time.time()  # Reset silence timer
-            
-            self._stream = sd.InputStream(
-                device=self.device_index,
-                samplerate=self.sample_rate,
-                channels=self.channels,
-                dtype=np.int16,
-                blocksize=self.chunk_size,
-                callback=self._audio_callback
+            # The reader thread is not running yet, so it cannot see this half-reset
+            self._buffer = np.empty(
+                (self.sample_rate * AudioConfig.INITIAL_BUFFER_SECONDS, self.channels),
+                dtype=np.int16
             )
+            self._buffer_len = 0
+            self._ring_pos = 0
+            self._truncated = False
+            self._peak_rms = 0.0
+            self._last_sound_time = time.time()  # Reset silence timer
+            self._peak_amp = 0.0
+            self._is_recording = True
+            
+            # The stream is kept open between recordings, so only the
+            # first recording (or a device change) pays for opening it
+            if self._stream is None:
+                self._stream = sd.InputStream(
+                    device=self.device_index,
+                    samplerate=self.sample_rate,
+                    channels=self.channels,
+                    dtype=np.int16,
+                    blocksize=self.chunk_size,
+                    latency="high"  # Larger driver buffer covers GIL stalls
+                )
+                with AudioRecorder._devices_lock:
+                    AudioRecorder._open_streams += 1
             self._stream.start()
+            
+            self._reader_thread = threading.Thread(target=self._read_loop, daemon=True)
+            self._reader_thread.start()
             return True
             
         except Exception as e:
             print(f"[AudioRecorder] Error starting: {e}")
             self._is_recording = False
+            self._close_stream()
             return False
     
     def stop(self) -> Optional[np.ndarray]:
@@ -169,19 +361,30 @@ class AudioRecorder:
             return None
         
         try:
-            with self._lock:
-                self._is_recording = False
+            self._is_recording = False
+            
+            # The loop exits after its current block; the buffer is no
+            # longer written once the thread has finished
+            if self._reader_thread:
+                self._reader_thread.join(timeout=1.0)
+                self._reader_thread = None
             
             if self._stream:
                 self._stream.stop()
-                self._stream.close()
-                self._stream = None
             
-            with self._lock:
-                if not self._frames:
-                    return None
-                audio_data = np.concatenate(self._frames, axis=0)
-                self._frames = []
+            if not self._buffer_len:
+                self._buffer = None
+                return None
+            if self._truncated:
+                # Unwrap so the oldest kept frame comes first
+                audio_data = np.concatenate(
+                    (self._buffer[self._ring_pos:], self._buffer[:self._ring_pos])
+                )
+            else:
+                # Hand the filled region over without copying
+                audio_data = self._buffer[:self._buffer_len]
+            self._buffer = None
+            self._buffer_len = 0
             
             return audio_data
             
@@ -189,6 +392,31 @@ class AudioRecorder:
             print(f"[AudioRecorder] Error stopping: {e}")
             return None
     
+    def close(self) -> None:
+        """Release the input device (the next start() reopens it)."""
+        if self._is_recording:
+            self.stop()
+        self._close_stream()
+    
+    @staticmethod
+    def _make_temp_path() -> Path:
+        """Create an empty temp WAV file and return its path."""
+        fd, temp_path = tempfile.mkstemp(suffix=".wav", prefix="v2t_")
+        os.close(fd)
+        return Path(temp_path)
+    
+    def _close_stream(self) -> None:
+        """Close the input stream, if any."""
+        if self._stream is None:
+            return
+        
+        try:
+            self._stream.close()
+        finally:
+            self._stream = None
+            with AudioRecorder._devices_lock:
+                AudioRecorder._open_streams -= 1
+    
     def save_to_file(self, audio_data: np.ndarray, filename: Optional[str] = None) -> Optional[Path]:
         """
         Save audio data to a WAV file.
@@ -208,25 +436,78 @@ class AudioRecorder:
                 filepath = DATA_DIR / filename
             else:
                 # Create temp file
-                fd, temp_path = tempfile.mkstemp(suffix=".wav", prefix="v2t_")
-                filepath = Path(temp_path)
-            
-            # Ensure int16 format
-            if audio_data.dtype != np.int16:
-                audio_data = (audio_data * 32767).astype(np.int16)
-            
-            with wave.open(str(filepath), "wb") as wf:
-                wf.setnchannels(self.channels)
-                wf.setsampwidth(2)  # 16-bit = 2 bytes
-                wf.setframerate(self.sample_rate)
-                wf.writeframes(audio_data.tobytes())
+                filepath = self._make_temp_path()
             
+            self._write_wav(str(filepath), audio_data)
             return filepath
             
         except Exception as e:
             print(f"[AudioRecorder] Error saving file: {e}")
             return None
     
+    def to_wav_bytes(self, audio_data: np.ndarray) -> Optional[bytes]:
+        """
+        Encode audio data as an in-memory WAV file.
+        Avoids the temp file round-trip when the audio is uploaded directly.
+        
+        Args:
+            audio_data: Numpy array of audio samples
+            
+        Returns:
+            WAV file content, or None if error
+        """
+        if audio_data is None or len(audio_data) == 0:
+            return None
+        
+        try:
+            buffer = io.BytesIO()
+            self._write_wav(buffer, audio_data)
+            return buffer.getvalue()
+            
+        except Exception as e:
+            print(f"[AudioRecorder] Error encoding WAV: {e}")
+            return None
+    
+    def _write_wav(self, target, audio_data: np.ndarray) -> None:
+        """Write int16 audio data as WAV to a path or file-like object."""
+        # The stream captures int16, so the samples are written as they are
+        if audio_data.dtype != np.int16:
+            raise ValueError(f"Expected int16 audio, got {audio_data.dtype}")
+        audio_data = np.ascontiguousarray(audio_data)  # No copy for recorder output
+        
+        with wave.open(target, "wb") as wf:
+            wf.setnchannels(self.channels)
+            wf.setsampwidth(AudioConfig.SAMPLE_WIDTH)
+            wf.setframerate(self.sample_rate)
+            wf.writeframes(memoryview(audio_data).cast("B"))
+    
+    def trim_silence(self, audio_data: np.ndarray) -> np.ndarray:
+        """
+        Cut leading and trailing silence from a recording.
+        Frames whose peak stays under 10% of the loudest frame count as
+        silence; a short margin is kept around the speech.
+        
+        Returns:
+            View of the trimmed region (the input itself if nothing to trim)
+        """
+        frame = AudioConfig.TRIM_FRAME
+        n_frames = len(audio_data) // frame
+        if n_frames == 0:
+            return audio_data
+        
+        # Per-frame peak in one vectorized pass (int32 so -32768 can be negated)
+        frames = audio_data[:n_frames * frame].reshape(n_frames, -1)
+        peaks = np.maximum(frames.max(axis=1), -frames.min(axis=1).astype(np.int32))
+        
+        voiced = np.flatnonzero(peaks > 0.1 * peaks.max())
+        if voiced.size == 0:
+            return audio_data
+        
+        margin = int(AudioConfig.TRIM_MARGIN_SECONDS * self.sample_rate)
+        start = max(0, voiced[0] * frame - margin)
+        end = min(len(audio_data), (voiced[-1] + 1) * frame + margin)
+        return audio_data[start:end]
+    
     def get_duration(self, audio_data: np.ndarray) -> float:
         """Get duration of audio data in seconds."""
         if audio_data is None or len(audio_data) == 0:
@@ -238,6 +519,28 @@ class AudioRecorder:
         """Check if currently recording."""
         return self._is_recording
     
+    @property
+    def has_speech(self) -> bool:
+        """Check if the last recording got louder than AudioConfig.MIN_SPEECH_RMS."""
+        return self._peak_rms >= AudioConfig.MIN_SPEECH_RMS
+    
+    @property
+    def was_truncated(self) -> bool:
+        """Check if the last recording exceeded AudioConfig.MAX_RECORD_SECONDS."""
+        return self._truncated
+    
+    @staticmethod
+    def _int16_rms(samples: np.ndarray) -> float:
+        """
+        RMS of a 1-D int16 array.
+        Squares are summed straight into an int64 accumulator, so no
+        float copy of the block is made (np.vdot would overflow in int16).
+        """
+        if samples.size == 0:
+            return 0.0
+        total = np.einsum("i,i->", samples, samples, dtype=np.int64)
+        return math.sqrt(total / samples.size)
+    
     def get_rms_level(self, audio_data: np.ndarray) -> float:
         """
         Calculate RMS (volume level) of audio data.
@@ -248,8 +551,7 @@ class AudioRecorder:
         if audio_data is None or len(audio_data) == 0:
             return 0.0
         
-        # Calculate RMS
-        rms = np.sqrt(np.mean(audio_data.astype(np.float32) ** 2))
+        rms = self._int16_rms(audio_data.ravel())
         
         # Normalize (assuming 16-bit audio max of 32767)
         normalized = min(rms / 32767 * 10, 1.0)  # Scale up for visibility
@@ -3,6 +3,9 @@ V2T 2.1 - Groq Whisper Transcriber
 Online transcription using Groq's Whisper API.
 """
 import os
+import struct
+import threading
+import wave
 from pathlib import Path
 from typing import Optional
 
@@ -31,23 +34,51 @@ class GroqTranscriber(BaseTranscriber):
         """
         self._api_key = api_key or os.getenv("key_groq_api")
         self._client = None
+        self._client_key: Optional[str] = None  # API key the client was built with
+        self._client_lock = threading.Lock()
     
     def _get_client(self):
-        """Get or create Groq client."""
-        if self._client is None and self._api_key:
+        """
+        Get or create the Groq client.
+        The client (and its HTTP connection pool) is kept across calls
+        and only rebuilt when the API key changes.
+        """
+        with self._client_lock:
+            if self._client is not None and self._client_key == self._api_key:
+                return self._client
+            
+            self._client = None
+            self._client_key = None
+            if not self._api_key:
+                return None
+            
             try:
                 from groq import Groq
                 self._client = Groq(api_key=self._api_key)
+                self._client_key = self._api_key
             except ImportError:
                 print("[GroqTranscriber] groq package not installed")
             except Exception as e:
                 print(f"[GroqTranscriber] Error creating client: {e}")
-        return self._client
+            return self._client
+    
+    def warm_up(self) -> None:
+        """
+        Import the SDK and build the client in a background thread,
+        so the first transcription does not pay for it.
+        """
+        if not self.is_available():
+            return
+        
+        thread = threading.Thread(target=self._get_client, daemon=True)
+        thread.start()
     
     def set_api_key(self, api_key: str) -> None:
         """Update the API key."""
-        self._api_key = api_key
-        self._client = None  # Reset client to use new key
+        with self._client_lock:
+            self._api_key = api_key
+            self._client = None  # Reset client to use new key
+            self._client_key = None
         
         # Also save to .env file
         try:
@@ -100,27 +131,99 @@ class GroqTranscriber(BaseTranscriber):
                 error=f"Fichier audio introuvable: {audio_path}"
             )
         
+        try:
+            duration = self._wav_duration(audio_path)
+            
+            # Transcribe, letting the HTTP client stream the open file
+            # instead of loading it into memory first
+            with open(audio_path, "rb") as audio_file:
+                return self._transcribe_file(
+                    (audio_path.name, audio_file, "audio/wav"), language, duration
+                )
+            
+        except Exception as e:
+            return TranscriptionResult(
+                text="",
+                language=language,
+                duration=0.0,
+                is_online=True,
+                success=False,
+                error=str(e)
+            )
+    
+    @staticmethod
+    def _wav_duration(audio_path: Path) -> float:
+        """
+        Get the duration of a WAV file from its header.
+        Files written by AudioRecorder have the canonical 44-byte header;
+        anything else goes through the wave module.
+        """
+        with open(audio_path, "rb") as f:
+            header = f.read(44)
+        
+        if (
+            len(header) == 44
+            and header[0:4] == b"RIFF"
+            and header[8:12] == b"WAVE"
+            and header[36:40] == b"data"
+        ):
+            byte_rate, = struct.unpack_from("<I", header, 28)
+            data_size, = struct.unpack_from("<I", header, 40)
+            if byte_rate:
+                return data_size / byte_rate
+        
+        with wave.open(str(audio_path), "rb") as wf:
+            return wf.getnframes() / float(wf.getframerate())
+    
+    def transcribe_bytes(
+        self,
+        wav_bytes: bytes,
+        language: str = "fr",
+        duration: float = 0.0
+    ) -> TranscriptionResult:
+        """
+        Transcribe an in-memory WAV file using Groq's Whisper API.
+        Skips the temp file write/read when the audio is already in memory.
+        
+        Args:
+            wav_bytes: WAV file content
+            language: Language code (e.g., "fr", "en")
+            duration: Duration of the audio in seconds
+            
+        Returns:
+            TranscriptionResult with transcribed text
+        """
+        if not self.is_available():
+            return TranscriptionResult(
+                text="",
+                language=language,
+                duration=0.0,
+                is_online=True,
+                success=False,
+                error="Clé API Groq non configurée"
+            )
+        
+        return self._transcribe_file(("audio.wav", wav_bytes, "audio/wav"), language, duration)
+    
+    def _transcribe_file(
+        self,
+        file: tuple,
+        language: str,
+        duration: float
+    ) -> TranscriptionResult:
+        """Send a (filename, content, content type) file to the transcription endpoint."""
         try:
             client = self._get_client()
             if not client:
                 raise Exception("Impossible de créer le client Groq")
             
-            # Get audio duration
-            import wave
-            with wave.open(str(audio_path), "rb") as wf:
-                frames = wf.getnframes()
-                rate = wf.getframerate()
-                duration = frames / float(rate)
-            
-            # Transcribe
-            with open(audio_path, "rb") as audio_file:
-                transcription = client.audio.transcriptions.create(
-                    file=(str(audio_path), audio_file.read()),
-                    model="whisper-large-v3",
-                    language=language,
-                    temperature=0.0,
-                    response_format="text"
-                )
+            transcription = client.audio.transcriptions.create(
+                file=file,
+                model="whisper-large-v3",
+                language=language,
+                temperature=0.0,
+                response_format="text"
+            )
             
             text = transcription.strip() if isinstance(transcription, str) else str(transcription).strip()
             
@@ -92,6 +92,8 @@ class HotkeyManager:
         """
         Wait for any key press and return it.
         Used for capturing custom hotkeys in settings.
+        Keys held together (e.g. "ctrl+shift+r") are returned as one
+        combination once the first key is released.
         
         Args:
             timeout: Maximum time to wait in seconds
@@ -99,11 +101,30 @@ class HotkeyManager:
         Returns:
             Key name or None if timeout
         """
+        pressed: list[str] = []
+        released = threading.Event()
+        
+        def on_event(event) -> None:
+            if event.event_type == keyboard.KEY_DOWN:
+                if event.name not in pressed:
+                    pressed.append(event.name)
+            elif pressed:
+                released.set()
+        
+        try:
+            hook = keyboard.hook(on_event)
+        except Exception:
+            return None
+        
         try:
-            event = keyboard.read_hotkey(suppress=False)
-            return event
+            # Sleeps until the hook fires or the timeout expires
+            if not released.wait(timeout):
+                return None
+            return keyboard.get_hotkey_name(list(pressed))
         except Exception:
             return None
+        finally:
+            keyboard.unhook(hook)
     
     def update_hotkey(self, old_key: str, new_key: str, callback: Callable) -> bool:
         """
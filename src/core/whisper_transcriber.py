@@ -2,15 +2,29 @@
 V2T 2.2 - Whisper Local Transcriber
 Offline transcription using faster-whisper (CTranslate2).
 """
+import gc
 import threading
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
+
 from src.utils.constants import TranscriptionConfig
 from src.core.transcriber import BaseTranscriber, TranscriptionResult
 from src.services.settings import settings
 
 
+# Decoder options shared by every call
+_DECODE_OPTIONS = dict(
+    beam_size=TranscriptionConfig.BEAM_SIZE,
+    temperature=TranscriptionConfig.TEMPERATURE,
+    vad_filter=True,
+    vad_parameters=dict(
+        min_silence_duration_ms=TranscriptionConfig.VAD_MIN_SILENCE_MS
+    )
+)
+
+
 class WhisperTranscriber(BaseTranscriber):
     """
     Offline transcription using faster-whisper.
@@ -40,11 +54,40 @@ class WhisperTranscriber(BaseTranscriber):
         
         self._model = None
         self._model_size = None
-        self._model_loading = False
-        self._model_loaded = False
+        # Events: readable from any thread without taking a lock
+        self._model_loading = threading.Event()
+        self._model_loaded = threading.Event()
+        self._load_lock = threading.Lock()  # One load at a time
         self._load_error: Optional[str] = None
         self._initialized = True
     
+    @staticmethod
+    def select_device() -> tuple:
+        """
+        Pick the fastest CTranslate2 device and compute type available.
+        int8 weights with float16 activations halve GPU memory traffic
+        compared to float16; CPUs use int8 (VNNI kernels when present).
+        
+        Returns:
+            (device, compute_type) tuple
+        """
+        try:
+            import ctranslate2
+            
+            if ctranslate2.get_cuda_device_count() > 0:
+                supported = ctranslate2.get_supported_compute_types("cuda")
+                for compute_type in ("int8_float16", "float16"):
+                    if compute_type in supported:
+                        return "cuda", compute_type
+            
+            supported = ctranslate2.get_supported_compute_types("cpu")
+            if "int8" not in supported:
+                return "cpu", "float32"
+        except Exception:
+            pass
+        
+        return "cpu", "int8"
+    
     def _get_configured_model(self) -> str:
         """Get the model size from settings."""
         return settings.get("whisper_model", TranscriptionConfig.WHISPER_MODEL)
@@ -56,37 +99,36 @@ class WhisperTranscriber(BaseTranscriber):
         """
         target_model = self._get_configured_model()
         
+        # Fast path without the lock
+        if self._model_loaded.is_set() and self._model_size == target_model:
+            return True
+        
+        # A caller arriving during a load waits for it instead of failing
+        with self._load_lock:
+            return self._load_model_locked(target_model)
+    
+    def _load_model_locked(self, target_model: str) -> bool:
+        """Load the model (caller holds _load_lock)."""
         # If model already loaded with correct size, return
-        if self._model_loaded and self._model_size == target_model:
+        if self._model_loaded.is_set() and self._model_size == target_model:
             return True
         
         # If a different model is loaded, unload it first
-        if self._model_loaded and self._model_size != target_model:
+        if self._model_loaded.is_set() and self._model_size != target_model:
             self.unload_model()
         
-        if self._model_loading:
-            return False
-        
-        self._model_loading = True
+        self._model_loading.set()
         self._model_size = target_model
         
         try:
             from faster_whisper import WhisperModel
             
             # Check for CUDA without requiring torch
-            device = "cpu"
-            compute_type = "int8"
-            
-            try:
-                import ctranslate2
-                if "cuda" in ctranslate2.get_supported_compute_types("cuda"):
-                    device = "cuda"
-                    compute_type = "float16"
-                    print("[WhisperTranscriber] Using CUDA GPU")
-                else:
-                    print("[WhisperTranscriber] Using CPU")
-            except Exception:
-                print("[WhisperTranscriber] Using CPU (CUDA not available)")
+            device, compute_type = self.select_device()
+            if device == "cuda":
+                print(f"[WhisperTranscriber] Using CUDA GPU ({compute_type})")
+            else:
+                print(f"[WhisperTranscriber] Using CPU ({compute_type})")
             
             print(f"[WhisperTranscriber] Loading model '{self._model_size}'...")
             
@@ -96,7 +138,9 @@ class WhisperTranscriber(BaseTranscriber):
                 compute_type=compute_type
             )
             
-            self._model_loaded = True
+            self._warm_up()
+            
+            self._model_loaded.set()
             self._load_error = None
             print("[WhisperTranscriber] Model loaded successfully")
             return True
@@ -110,11 +154,25 @@ class WhisperTranscriber(BaseTranscriber):
             print(f"[WhisperTranscriber] Error loading model: {e}")
         
         finally:
-            self._model_loading = False
+            self._model_loading.clear()
         
         return False
 
     
+    def _warm_up(self) -> None:
+        """
+        Run a tiny inference so kernel selection and allocations happen
+        now rather than on the user's first recording.
+        """
+        try:
+            silence = np.zeros(1600, dtype=np.float32)  # 0.1 s at 16 kHz
+            segments, _ = self._model.transcribe(
+                silence, language="en", beam_size=1, vad_filter=False
+            )
+            list(segments)  # Segments are generated lazily
+        except Exception as e:
+            print(f"[WhisperTranscriber] Warm-up skipped: {e}")
+    
     def load_async(self, callback: Optional[callable] = None) -> None:
         """
         Load the model asynchronously in a background thread.
@@ -132,11 +190,11 @@ class WhisperTranscriber(BaseTranscriber):
     
     def is_available(self) -> bool:
         """Check if the transcriber is ready to use."""
-        return self._model_loaded
+        return self._model_loaded.is_set()
     
     def is_loading(self) -> bool:
         """Check if model is currently loading."""
-        return self._model_loading
+        return self._model_loading.is_set()
     
     @property
     def name(self) -> str:
@@ -162,8 +220,50 @@ class WhisperTranscriber(BaseTranscriber):
         Returns:
             TranscriptionResult with transcribed text
         """
+        if not audio_path.exists():
+            return TranscriptionResult(
+                text="",
+                language=language,
+                duration=0.0,
+                is_online=False,
+                success=False,
+                error=f"Fichier audio introuvable: {audio_path}"
+            )
+        
+        return self._run(str(audio_path), language)
+    
+    def transcribe_array(
+        self,
+        audio_data: np.ndarray,
+        language: str = "fr",
+        cancel: Optional[threading.Event] = None
+    ) -> TranscriptionResult:
+        """
+        Transcribe recorded samples directly, without a WAV round-trip.
+        
+        Args:
+            audio_data: int16 samples at 16 kHz, shape (frames,) or (frames, channels)
+            language: Language code (e.g., "fr", "en")
+            cancel: When set, decoding stops before the next segment
+            
+        Returns:
+            TranscriptionResult with transcribed text
+        """
+        if audio_data.ndim > 1:
+            audio_data = audio_data.mean(axis=1) if audio_data.shape[1] > 1 else audio_data[:, 0]
+        # faster-whisper takes float32 in [-1, 1)
+        samples = np.multiply(audio_data, 1.0 / 32768.0, dtype=np.float32)
+        return self._run(samples, language, cancel)
+    
+    def _run(
+        self,
+        audio,
+        language: str,
+        cancel: Optional[threading.Event] = None
+    ) -> TranscriptionResult:
+        """Decode a file path or float32 array with the loaded model."""
         # Ensure model is loaded
-        if not self._model_loaded:
+        if not self._model_loaded.is_set():
             if not self._load_model():
                 return TranscriptionResult(
                     text="",
@@ -174,31 +274,26 @@ class WhisperTranscriber(BaseTranscriber):
                     error=self._load_error or "Impossible de charger le modèle Whisper"
                 )
         
-        if not audio_path.exists():
-            return TranscriptionResult(
-                text="",
-                language=language,
-                duration=0.0,
-                is_online=False,
-                success=False,
-                error=f"Fichier audio introuvable: {audio_path}"
-            )
-        
         try:
             # Transcribe with VAD filter for better results
             segments, info = self._model.transcribe(
-                str(audio_path),
+                audio,
                 language=language,
-                beam_size=5,
-                vad_filter=True,
-                vad_parameters=dict(
-                    min_silence_duration_ms=500
-                )
+                **_DECODE_OPTIONS
             )
             
-            # Combine all segments
+            # Combine all segments (decoded lazily, one window per step)
             text_parts = []
             for segment in segments:
+                if cancel is not None and cancel.is_set():
+                    return TranscriptionResult(
+                        text="",
+                        language=language,
+                        duration=0.0,
+                        is_online=False,
+                        success=False,
+                        error="Transcription annulée"
+                    )
                 text_parts.append(segment.text.strip())
             
             text = " ".join(text_parts)
@@ -226,12 +321,11 @@ class WhisperTranscriber(BaseTranscriber):
         if self._model:
             del self._model
             self._model = None
-            self._model_loaded = False
+            self._model_loaded.clear()
             self._model_size = None
             
             # Try to free GPU memory via ctranslate2
             try:
-                import gc
                 gc.collect()
             except Exception:
                 pass
@@ -0,0 +1,134 @@
+"""
+V2T 2.1 - Windows Input
+Synthetic keyboard input through a single Win32 SendInput call.
+"""
+import bisect
+import ctypes
+import sys
+from typing import List
+
+
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_UNICODE = 0x0004
+VK_RETURN = 0x0D
+VK_CONTROL = 0x11
+VK_V = 0x56
+
+_SendInput = None
+
+if sys.platform == "win32":
+    from ctypes import wintypes
+    
+    class _KEYBDINPUT(ctypes.Structure):
+        _fields_ = [
+            ("wVk", wintypes.WORD),
+            ("wScan", wintypes.WORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),  # ULONG_PTR
+        ]
+    
+    class _MOUSEINPUT(ctypes.Structure):
+        # Largest union member: needed so sizeof(INPUT) matches Windows
+        _fields_ = [
+            ("dx", wintypes.LONG),
+            ("dy", wintypes.LONG),
+            ("mouseData", wintypes.DWORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),
+        ]
+    
+    class _INPUTUNION(ctypes.Union):
+        _fields_ = [("ki", _KEYBDINPUT), ("mi", _MOUSEINPUT)]
+    
+    class _INPUT(ctypes.Structure):
+        _fields_ = [("type", wintypes.DWORD), ("union", _INPUTUNION)]
+    
+    try:
+        _SendInput = ctypes.windll.user32.SendInput
+        _SendInput.argtypes = (wintypes.UINT, ctypes.POINTER(_INPUT), ctypes.c_int)
+        _SendInput.restype = wintypes.UINT
+    except Exception as e:
+        print(f"[WinInput] SendInput unavailable: {e}")
+        _SendInput = None
+
+
+def is_available() -> bool:
+    """True when input can be sent with SendInput."""
+    return _SendInput is not None
+
+
+def _key(vk: int = 0, scan: int = 0, flags: int = 0) -> "_INPUT":
+    """Build one keyboard INPUT record."""
+    event = _INPUT(type=INPUT_KEYBOARD)
+    event.union.ki = _KEYBDINPUT(wVk=vk, wScan=scan, dwFlags=flags, time=0, dwExtraInfo=0)
+    return event
+
+
+def _send(events: List["_INPUT"]) -> int:
+    """Inject all events at once; returns how many Windows accepted."""
+    count = len(events)
+    if not count:
+        return 0
+    array = (_INPUT * count)(*events)
+    return _SendInput(count, array, ctypes.sizeof(_INPUT))
+
+
+def type_text(text: str) -> int:
+    """
+    Type text into the focused window.
+    
+    Args:
+        text: Text to type (newlines are sent as Enter)
+    
+    Returns:
+        Number of leading characters of text that were fully injected
+        (0 if SendInput is unavailable or blocked)
+    """
+    if _SendInput is None:
+        return 0
+    
+    events = []
+    char_ends = []  # Event count once each character of text is queued
+    for line_index, line in enumerate(text.split("\n")):
+        if line_index:
+            events.append(_key(vk=VK_RETURN))
+            events.append(_key(vk=VK_RETURN, flags=KEYEVENTF_KEYUP))
+            char_ends.append(len(events))
+        
+        for char in line:
+            if char != "\r":
+                # KEYEVENTF_UNICODE takes UTF-16 code units (surrogate pairs as two)
+                data = char.encode("utf-16-le")
+                for i in range(0, len(data), 2):
+                    unit = data[i] | (data[i + 1] << 8)
+                    events.append(_key(scan=unit, flags=KEYEVENTF_UNICODE))
+                    events.append(_key(scan=unit, flags=KEYEVENTF_UNICODE | KEYEVENTF_KEYUP))
+            char_ends.append(len(events))
+    
+    injected = _send(events)
+    if injected >= len(events):
+        return len(text)
+    # Events go out in order, so the typed part is a prefix of text
+    return bisect.bisect_right(char_ends, injected)
+
+
+def send_paste() -> bool:
+    """
+    Send Ctrl+V to the focused window.
+    
+    Returns:
+        True if the key events were injected
+    """
+    if _SendInput is None:
+        return False
+    
+    events = [
+        _key(vk=VK_CONTROL),
+        _key(vk=VK_V),
+        _key(vk=VK_V, flags=KEYEVENTF_KEYUP),
+        _key(vk=VK_CONTROL, flags=KEYEVENTF_KEYUP),
+    ]
+    return _send(events) == len(events)
@@ -3,11 +3,35 @@ V2T 2.1 - Settings Manager
 Handles loading and saving user preferences.
 """
 import json
+import os
 import threading
+from dataclasses import dataclass, fields
 from typing import Any, Optional
 from pathlib import Path
 
-from src.utils.constants import CONFIG_FILE, DEFAULT_SETTINGS
+from src.utils.constants import CONFIG_FILE, DEFAULT_SETTINGS, SETTINGS_SAVE_DELAY
+
+
+@dataclass(frozen=True, slots=True)
+class SettingsSnapshot:
+    """Typed, read-only view of the settings read on hot paths."""
+    language: str
+    use_online: bool
+    parallel_transcribe: bool
+    hotkey: str
+    sound_enabled: bool
+    auto_paste: bool
+    silence_detection_enabled: bool
+    silence_threshold_seconds: int
+    mic_index: Optional[int]
+    
+    @classmethod
+    def from_dict(cls, values: dict) -> "SettingsSnapshot":
+        """Build a snapshot, falling back to defaults for missing keys."""
+        return cls(**{
+            f.name: values.get(f.name, DEFAULT_SETTINGS.get(f.name))
+            for f in fields(cls)
+        })
 
 
 class SettingsManager:
@@ -22,18 +46,26 @@ class SettingsManager:
         if cls._instance is None:
             with cls._lock:
                 if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
+                    # Fully set up before publishing, so no caller sees a
+                    # half-initialized instance and setup runs exactly once
+                    instance = super().__new__(cls)
+                    instance._setup()
+                    cls._instance = instance
         return cls._instance
     
-    def __init__(self):
-        if self._initialized:
-            return
-        
+    def _setup(self) -> None:
+        """Initialize state and load settings from disk (first construction only)."""
+        # Copy-on-write: the dict is never mutated once published, so
+        # readers can use it without taking the lock
         self._settings: dict = dict(DEFAULT_SETTINGS)
-        self._settings_lock = threading.Lock()
+        self._snapshot = SettingsSnapshot.from_dict(self._settings)
+        self._settings_lock = threading.Lock()  # Serializes writers
+        self._save_lock = threading.Lock()  # Serializes writers of the temp file
+        self._last_saved: Optional[str] = None  # Last JSON written to disk
+        self._dirty = False  # Changes waiting for the debounced save
+        self._save_timer: Optional[threading.Timer] = None
+        self._timer_lock = threading.Lock()
         self._load()
-        self._initialized = True
     
     def _load(self) -> None:
         """Load settings from JSON file."""
@@ -42,7 +74,7 @@ class SettingsManager:
                 with open(CONFIG_FILE, "r", encoding="utf-8") as f:
                     data = json.load(f)
                 with self._settings_lock:
-                    self._settings.update(data)
+                    self._publish({**self._settings, **data})
             except (json.JSONDecodeError, IOError) as e:
                 print(f"[Settings] Error loading settings: {e}")
     
@@ -52,35 +84,75 @@ class SettingsManager:
             # Ensure parent directory exists
             CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
             
-            with self._settings_lock:
-                payload = dict(self._settings)
-            
-            with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-                json.dump(payload, f, indent=4, ensure_ascii=False)
-        except IOError as e:
+            with self._save_lock:
+                # Snapshot under the lock: a save that started earlier can
+                # never write an older dict over a newer one
+                data = json.dumps(self._settings, indent=4, ensure_ascii=False)
+                if data == self._last_saved:
+                    return  # Nothing changed since the last write
+                
+                # Write a sibling file then swap it in, so readers never
+                # see a half-written settings file
+                tmp_path = CONFIG_FILE.with_name(CONFIG_FILE.name + ".tmp")
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())  # Contents on disk before the swap
+                os.replace(tmp_path, CONFIG_FILE)
+                self._last_saved = data
+        except (IOError, TypeError, ValueError) as e:
             print(f"[Settings] Error saving settings: {e}")
     
+    def _schedule_save(self) -> None:
+        """Mark settings dirty and (re)arm the debounced save."""
+        with self._timer_lock:
+            self._dirty = True
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(SETTINGS_SAVE_DELAY, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    def flush(self) -> None:
+        """Write pending changes now, if any. Call before quitting."""
+        with self._timer_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            pending = self._dirty
+            self._dirty = False
+        if pending:
+            self.save()
+    
+    def _publish(self, new_settings: dict) -> None:
+        """Swap in a new settings dict and its snapshot (hold _settings_lock)."""
+        self._settings = new_settings
+        self._snapshot = SettingsSnapshot.from_dict(new_settings)
+    
+    @property
+    def snapshot(self) -> SettingsSnapshot:
+        """Current typed view; rebuilt on every write, never changes in place."""
+        return self._snapshot
+    
     def get(self, key: str, default: Any = None) -> Any:
         """Get a setting value."""
-        with self._settings_lock:
-            return self._settings.get(key, default)
+        return self._settings.get(key, default)
     
     def set(self, key: str, value: Any, auto_save: bool = True) -> None:
         """Set a setting value."""
         with self._settings_lock:
-            self._settings[key] = value
+            self._publish({**self._settings, key: value})
         if auto_save:
-            self.save()
+            self._schedule_save()
     
     def get_all(self) -> dict:
         """Get all settings as a dictionary copy."""
-        with self._settings_lock:
-            return dict(self._settings)
+        return dict(self._settings)
     
     def reset_to_defaults(self) -> None:
         """Reset all settings to default values."""
         with self._settings_lock:
-            self._settings = dict(DEFAULT_SETTINGS)
+            self._publish(dict(DEFAULT_SETTINGS))
         self.save()
 
 
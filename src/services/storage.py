@@ -2,7 +2,9 @@
 V2T 2.1 - Database Storage
 SQLite database for storing transcription history.
 """
+import threading
 from datetime import datetime
+from functools import wraps
 from typing import List, Optional
 from peewee import (
     SqliteDatabase, 
@@ -18,8 +20,22 @@ from peewee import (
 from src.utils.constants import DATABASE_FILE
 
 
-# Initialize database
-db = SqliteDatabase(str(DATABASE_FILE))
+# Initialize database (WAL + NORMAL sync: one fsync per checkpoint, not per commit).
+# A single connection is shared by every thread; TranscriptStorage serializes
+# access so worker threads don't each open a connection and replay the pragmas.
+db = SqliteDatabase(
+    str(DATABASE_FILE),
+    thread_safe=False,
+    check_same_thread=False,
+    pragmas={
+        "journal_mode": "wal",
+        "synchronous": "normal",
+        "cache_size": -64000,  # 64 MB
+        "temp_store": "memory",
+        "mmap_size": 268435456,  # 256 MB
+        "foreign_keys": 1,
+    }
+)
 
 
 class BaseModel(Model):
@@ -56,6 +72,15 @@ class Transcript(BaseModel):
         }
 
 
+def _serialized(method):
+    """Run a TranscriptStorage method while holding the connection lock."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
 class TranscriptStorage:
     """
     Storage manager for transcripts.
@@ -63,14 +88,17 @@ class TranscriptStorage:
     """
     
     def __init__(self):
+        self._lock = threading.RLock()  # Guards the shared connection
         self._init_db()
     
+    @_serialized
     def _init_db(self) -> None:
         """Initialize database and create tables if needed."""
         DATABASE_FILE.parent.mkdir(parents=True, exist_ok=True)
         db.connect(reuse_if_open=True)
         db.create_tables([Transcript], safe=True)
     
+    @_serialized
     def save(
         self, 
         text: str, 
@@ -78,28 +106,41 @@ class TranscriptStorage:
         duration: float = 0.0,
         is_online: bool = True,
         title: Optional[str] = None
-    ) -> Transcript:
+    ) -> int:
         """
         Save a new transcription to the database.
         Auto-generates title from first words if not provided.
-        """
-        if not title:
-            # Generate title from first few words
-            words = text.split()[:5]
-            title = " ".join(words)[:50]
-            if len(text.split()) > 5:
-                title += "..."
         
-        transcript = Transcript.create(
-            title=title,
-            text=text,
-            language=language,
-            duration=duration,
-            is_online=is_online,
-            created_at=datetime.now()
+        The row is written with a single parameterized INSERT; no
+        Transcript instance is built.
+        
+        Returns:
+            ID of the new row
+        """
+        cursor = db.execute_sql(
+            "INSERT INTO transcripts (title, text, language, duration, is_online, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                title or self._make_title(text),
+                text,
+                language,
+                duration,
+                is_online,
+                datetime.now().isoformat(" "),
+            )
         )
-        return transcript
+        return cursor.lastrowid
+    
+    @staticmethod
+    def _make_title(text: str) -> str:
+        """Generate a title from the first few words."""
+        words = text.split(None, 5)  # Stop scanning after the sixth word
+        title = " ".join(words[:5])[:50]
+        if len(words) > 5:
+            title += "..."
+        return title
     
+    @_serialized
     def get_all(self, limit: int = 100) -> List[Transcript]:
         """Get all transcripts, newest first."""
         return list(
@@ -109,6 +150,7 @@ class TranscriptStorage:
             .limit(limit)
         )
     
+    @_serialized
     def get_by_id(self, transcript_id: int) -> Optional[Transcript]:
         """Get a specific transcript by ID."""
         try:
@@ -116,15 +158,12 @@ class TranscriptStorage:
         except Transcript.DoesNotExist:
             return None
     
+    @_serialized
     def delete(self, transcript_id: int) -> bool:
         """Delete a transcript by ID."""
-        try:
-            transcript = Transcript.get_by_id(transcript_id)
-            transcript.delete_instance()
-            return True
-        except Transcript.DoesNotExist:
-            return False
+        return Transcript.delete().where(Transcript.id == transcript_id).execute() > 0
     
+    @_serialized
     def search(self, query: str, limit: int = 50) -> List[Transcript]:
         """Search transcripts by text content."""
         return list(
@@ -135,23 +174,32 @@ class TranscriptStorage:
             .limit(limit)
         )
     
+    @_serialized
     def update_title(self, transcript_id: int, new_title: str) -> bool:
         """Update the title of a transcript."""
-        try:
-            transcript = Transcript.get_by_id(transcript_id)
-            transcript.title = new_title
-            transcript.save()
-            return True
-        except Transcript.DoesNotExist:
-            return False
+        query = Transcript.update(title=new_title).where(Transcript.id == transcript_id)
+        return query.execute() > 0
     
+    @_serialized
     def count(self) -> int:
         """Get total number of transcripts."""
         return Transcript.select().count()
     
+    @_serialized
     def clear_all(self) -> int:
         """Delete all transcripts. Returns number deleted."""
-        return Transcript.delete().execute()
+        deleted = Transcript.delete().execute()
+        if deleted:
+            self.vacuum()
+        return deleted
+    
+    @_serialized
+    def vacuum(self) -> None:
+        """Rebuild the database file to release the space of deleted rows."""
+        try:
+            db.execute_sql("VACUUM")
+        except Exception as e:
+            print(f"[Storage] Error compacting database: {e}")
 
 
 # Global instance
@@ -38,13 +38,22 @@ class TrayIconManager:
         self._icon: Optional[pystray.Icon] = None
         self._thread: Optional[threading.Thread] = None
         self._running = False
+        self._icon_image: Optional[Image.Image] = None  # Decoded once, reused
     
     def _create_icon_image(self) -> Image.Image:
+        """Return the tray icon image, loading or drawing it on first use."""
+        if self._icon_image is None:
+            self._icon_image = self._load_icon_image()
+        return self._icon_image
+    
+    def _load_icon_image(self) -> Image.Image:
         """Load or create the tray icon image."""
         # Try to load custom icon
         if ICON_FILE.exists():
             try:
-                return Image.open(str(ICON_FILE))
+                img = Image.open(str(ICON_FILE))
+                img.load()  # Decode now and release the file handle
+                return img
             except Exception:
                 pass
         
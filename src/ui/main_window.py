@@ -2,29 +2,39 @@
 V2T 2.1 - Main Window
 Central window managing all pages and navigation.
 """
+import queue
 import threading
+import wave
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
 from pathlib import Path
 
 from PyQt6.QtWidgets import (
-    QMainWindow, QStackedWidget, QWidget,
+    QApplication, QMainWindow, QStackedWidget, QWidget,
     QVBoxLayout, QSystemTrayIcon, QMenu
 )
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QObject
 from PyQt6.QtGui import QIcon
 
-import pyperclip
+import keyboard
 import numpy as np
 
-from src.utils.constants import Colors, UIConfig, ICON_FILE
+try:
+    import winsound  # Windows only: playback when QtMultimedia is missing
+except ImportError:
+    winsound = None
+
+from src.utils.constants import Colors, UIConfig, AudioConfig, ICON_FILE, SOUND_FILE, BEEP_FILE
 from src.ui.styles.theme import get_main_stylesheet
 from src.ui.pages.home_page import HomePage
 from src.ui.pages.history_page import HistoryPage
 from src.ui.pages.settings_page import SettingsPage
+from src.core import win_input
 from src.core.audio_recorder import AudioRecorder
 from src.core.hotkey_manager import hotkey_manager
 from src.core.groq_transcriber import groq_transcriber
 from src.core.whisper_transcriber import whisper_transcriber
+from src.core.transcriber import TranscriptionResult
 from src.services.settings import settings
 from src.services.storage import storage
 
@@ -35,10 +45,22 @@ class MainWindow(QMainWindow):
     Manages page navigation and core functionality.
     """
     
+    # Transcription status codes, sent with the result text
+    STATUS_OK = 0
+    STATUS_SAVE_ERROR = 1
+    STATUS_TRANSCRIBE_ERROR = 2
+    STATUS_EXCEPTION = 3
+    
+    # Fixed status messages; other codes show their error text
+    _STATUS_MESSAGES = {
+        STATUS_OK: "Transcription terminée (Copié !)",
+        STATUS_SAVE_ERROR: "Erreur: impossible de sauvegarder l'audio",
+    }
+    
     # Internal signals for thread-safe UI updates
-    _transcription_complete = pyqtSignal(str, bool)
-    _audio_data_ready = pyqtSignal(object)
+    _transcription_complete = pyqtSignal(int, str)  # status code, text or error
     _hotkey_triggered = pyqtSignal()  # Thread-safe hotkey signal
+    _silence_detected = pyqtSignal()  # Recorder heard nothing for the configured delay
     _show_notification = pyqtSignal(str, str)  # title, message
     
     def __init__(self):
@@ -49,12 +71,30 @@ class MainWindow(QMainWindow):
         self._is_transcribing = False
         self._current_audio_data: Optional[np.ndarray] = None
         self._tray_manager = None
+        self._sound_effect = None
+        self._sound_path: Optional[Path] = None
+        self._latest_chunk: Optional[np.ndarray] = None  # Written by the audio thread
+        self._transcribe_jobs: "queue.Queue" = queue.Queue()
+        self._transcribe_thread: Optional[threading.Thread] = None  # Started on first use
+        self._load_cached_settings()
         
         self._setup_window()
         self._setup_pages()
         self._setup_connections()
         self._setup_hotkey()
         self._setup_audio()
+        self._setup_sound()
+        
+        # Waveform refresh, decoupled from the audio block rate
+        self._waveform_timer = QTimer(self)
+        self._waveform_timer.setInterval(UIConfig.WAVEFORM_REFRESH_MS)
+        self._waveform_timer.timeout.connect(self._flush_waveform)
+        
+        if self._cfg_use_online:
+            groq_transcriber.warm_up()
+        if not self._cfg_use_online or self._cfg_parallel:
+            # Load (and warm up) the local model before the first recording
+            whisper_transcriber.load_async()
     
     def set_tray_manager(self, tray_manager) -> None:
         """Set the tray manager for notifications."""
@@ -119,13 +159,13 @@ class MainWindow(QMainWindow):
         
         # Internal signals (thread-safe)
         self._transcription_complete.connect(self._on_transcription_result)
-        self._audio_data_ready.connect(self._on_audio_data)
         self._hotkey_triggered.connect(self._on_hotkey_main_thread)
+        self._silence_detected.connect(self._on_silence_main_thread)
         self._show_notification.connect(self._on_show_notification)
     
     def _setup_hotkey(self) -> None:
         """Setup global hotkey."""
-        hotkey = settings.get("hotkey", "F8")
+        hotkey = settings.snapshot.hotkey
         # Use a lambda that emits a signal instead of direct UI manipulation
         hotkey_manager.register(hotkey, self._emit_hotkey_signal)
         self._home_page.update_hotkey_text(hotkey)
@@ -143,7 +183,7 @@ class MainWindow(QMainWindow):
     
     def _setup_audio(self) -> None:
         """Setup audio recorder."""
-        mic_index = settings.get("mic_index")
+        mic_index = settings.snapshot.mic_index
         self._audio_recorder = AudioRecorder(device_index=mic_index)
         self._audio_recorder.set_audio_callback(self._on_audio_callback)
     
@@ -154,12 +194,14 @@ class MainWindow(QMainWindow):
         self._stack.setCurrentWidget(self._home_page)
     
     def _show_history(self) -> None:
-        """Navigate to history page."""
-        self._history_page.load_transcripts()
+        """Navigate to history page (it reloads itself if stale)."""
         self._stack.setCurrentWidget(self._history_page)
     
     def _show_settings(self) -> None:
         """Navigate to settings page."""
+        # Release the microphone so the device list can be rescanned
+        if self._audio_recorder and not self._is_recording:
+            self._audio_recorder.close()
         self._settings_page.refresh()
         self._stack.setCurrentWidget(self._settings_page)
     
@@ -196,7 +238,14 @@ class MainWindow(QMainWindow):
         
         # Start recorder
         if self._audio_recorder:
+            if self._cfg_silence_enabled:
+                self._audio_recorder.update_silence_threshold(self._cfg_silence_seconds)
+                self._audio_recorder.set_silence_callback(self._silence_detected.emit)
+            else:
+                self._audio_recorder.set_silence_callback(None)
+            
             self._audio_recorder.start()
+            self._waveform_timer.start()
     
     def _stop_recording(self) -> None:
         """Stop recording and start transcription."""
@@ -208,13 +257,27 @@ class MainWindow(QMainWindow):
         
         # Update UI
         self._is_recording = False
+        self._waveform_timer.stop()
+        self._latest_chunk = None
         self._home_page.set_recording(False)
         
         # Stop recorder and get audio
         if self._audio_recorder:
             audio_data = self._audio_recorder.stop()
             
-            if audio_data is not None and len(audio_data) > 0:
+            if self._audio_recorder.was_truncated:
+                minutes = AudioConfig.MAX_RECORD_SECONDS // 60
+                self._on_notification_requested(
+                    "V2T",
+                    f"Enregistrement tronqué aux {minutes} dernières minutes"
+                )
+            
+            if audio_data is not None and len(audio_data) > 0 and not self._audio_recorder.has_speech:
+                # Only background noise: don't spend an upload on it
+                self._home_page.update_waveform(None)
+                self._home_page.set_transcription_result(False, "Aucune voix détectée")
+                QTimer.singleShot(3000, self._reset_transcription_status)
+            elif audio_data is not None and len(audio_data) > 0:
                 self._current_audio_data = audio_data
                 self._is_transcribing = True
                 self._home_page.set_transcribing(True)
@@ -223,42 +286,43 @@ class MainWindow(QMainWindow):
                 # No audio recorded
                 self._home_page.update_waveform(None)
     
+    def _on_silence_main_thread(self) -> None:
+        """Auto-stop recording after a silence (main thread)."""
+        if self._is_recording:
+            self._stop_recording()
+    
     def _on_audio_callback(self, audio_chunk: np.ndarray) -> None:
         """Handle real-time audio data from recorder."""
-        # Emit signal to update UI in main thread
-        self._audio_data_ready.emit(audio_chunk)
+        # Keep only the newest block; the waveform timer picks it up
+        self._latest_chunk = audio_chunk
     
-    def _on_audio_data(self, audio_chunk) -> None:
-        """Update waveform with audio data (main thread)."""
-        if self._is_recording:
+    def _flush_waveform(self) -> None:
+        """Update waveform with the latest audio block (main thread)."""
+        audio_chunk, self._latest_chunk = self._latest_chunk, None
+        if audio_chunk is not None and self._is_recording:
             self._home_page.update_waveform(audio_chunk)
     
     # === Transcription ===
     
     def _start_transcription(self, audio_data: np.ndarray) -> None:
-        """Start transcription in background thread."""
+        """Start transcription on the background worker thread."""
         def transcribe():
             try:
-                # Save audio to temp file
-                audio_path = self._audio_recorder.save_to_file(audio_data)
-                if not audio_path:
-                    self._transcription_complete.emit("Erreur: impossible de sauvegarder l'audio", False)
-                    return
-                
-                language = settings.get("language", "fr")
-                use_online = settings.get("use_online", True)
+                language = self._cfg_language
+                use_online = self._cfg_use_online
                 
                 # Choose transcriber
-                if use_online and groq_transcriber.is_available():
-                    result = groq_transcriber.transcribe(audio_path, language)
+                online = use_online and groq_transcriber.is_available()
+                if online and self._cfg_parallel and whisper_transcriber.is_available():
+                    result = self._transcribe_parallel(audio_data, language)
+                elif online:
+                    result = self._transcribe_online(audio_data, language)
                 else:
-                    result = whisper_transcriber.transcribe(audio_path, language)
+                    result = self._transcribe_offline(audio_data, language)
                 
-                # Clean up temp file
-                try:
-                    audio_path.unlink()
-                except Exception:
-                    pass
+                if result is None:
+                    self._transcription_complete.emit(self.STATUS_SAVE_ERROR, "")
+                    return
                 
                 if result.success:
                     # Save to history
@@ -269,43 +333,126 @@ class MainWindow(QMainWindow):
                         is_online=result.is_online
                     )
                     
-                    # Copy to clipboard
-                    try:
-                        pyperclip.copy(result.text)
-                    except Exception:
-                        pass
-                    
-                    # Auto-paste if enabled
-                    if settings.get("auto_paste", True):
-                        self._auto_paste(result.text)
-                    
-                    self._transcription_complete.emit(result.text, True)
+                    # Clipboard and paste happen on the main thread
+                    self._transcription_complete.emit(self.STATUS_OK, result.text)
                 else:
-                    self._transcription_complete.emit(result.error or "Erreur inconnue", False)
+                    self._transcription_complete.emit(
+                        self.STATUS_TRANSCRIBE_ERROR, result.error or "Erreur inconnue"
+                    )
                     
             except Exception as e:
-                self._transcription_complete.emit(str(e), False)
+                self._transcription_complete.emit(self.STATUS_EXCEPTION, str(e))
+        
+        if self._transcribe_thread is None:
+            self._transcribe_thread = threading.Thread(
+                target=self._transcribe_loop, daemon=True
+            )
+            self._transcribe_thread.start()
+        self._transcribe_jobs.put(transcribe)
+    
+    def _transcribe_loop(self) -> None:
+        """Run queued transcriptions one after another (worker thread)."""
+        while True:
+            job = self._transcribe_jobs.get()
+            job()
+    
+    def _transcribe_online(self, audio_data: np.ndarray, language: str) -> Optional[TranscriptionResult]:
+        """Transcribe with Groq (None if the audio could not be encoded)."""
+        # Upload straight from memory, no temp file
+        wav_bytes = self._audio_recorder.to_wav_bytes(
+            self._audio_recorder.trim_silence(audio_data)
+        )
+        if not wav_bytes:
+            return None
         
-        threading.Thread(target=transcribe, daemon=True).start()
+        return groq_transcriber.transcribe_bytes(
+            wav_bytes,
+            language,
+            self._audio_recorder.get_duration(audio_data)
+        )
+    
+    def _transcribe_offline(
+        self,
+        audio_data: np.ndarray,
+        language: str,
+        cancel: Optional[threading.Event] = None
+    ) -> TranscriptionResult:
+        """Transcribe with local Whisper straight from the recorded samples."""
+        result = whisper_transcriber.transcribe_array(
+            self._audio_recorder.trim_silence(audio_data), language, cancel
+        )
+        if result.success:
+            # Save the recording's length, as the online path does, not the trimmed one
+            result.duration = self._audio_recorder.get_duration(audio_data)
+        return result
+    
+    def _transcribe_parallel(self, audio_data: np.ndarray, language: str) -> Optional[TranscriptionResult]:
+        """
+        Run Groq and the loaded local model side by side and keep the
+        first successful result, so a slow or failing API does not stall.
+        """
+        cancel = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=2)
+        futures = [
+            executor.submit(self._transcribe_online, audio_data, language),
+            executor.submit(self._transcribe_offline, audio_data, language, cancel),
+        ]
+        # Don't wait for the slower backend once a result is in
+        executor.shutdown(wait=False)
+        
+        failed = None
+        try:
+            for future in as_completed(futures):
+                result = future.result()
+                if result is not None and result.success:
+                    return result
+                failed = failed or result
+            return failed
+        finally:
+            # A losing local decode stops at its next segment instead of
+            # competing for the CPU with the next recording
+            cancel.set()
     
     def _auto_paste(self, text: str) -> None:
-        """Simulate Ctrl+V (runs in transcription thread)."""
+        """Type the text into the active window (runs in a paste thread)."""
+        # On Windows the whole text goes out in a single SendInput call
+        typed = win_input.type_text(text)
+        if typed == len(text):
+            return
+        
+        if not typed:
+            try:
+                # Typing directly skips the clipboard round-trip and its settle delay
+                keyboard.write(text, delay=0)
+                return
+            except Exception:
+                pass
+        
+        # Some applications reject synthetic unicode input, and retyping after
+        # a partial SendInput would repeat what already went out: paste instead
+        if win_input.send_paste():
+            return
         try:
-            import time
-            time.sleep(0.05)
-            import keyboard
             keyboard.press_and_release("ctrl+v")
         except Exception as e:
             print(f"[Clipboard] Error pasting: {e}")
     
-    def _on_transcription_result(self, text: str, success: bool) -> None:
+    def _on_transcription_result(self, status: int, text: str) -> None:
         """Handle transcription result (main thread)."""
         self._is_transcribing = False
         
+        success = status == self.STATUS_OK
         if success:
-            self._home_page.set_transcription_result(True, "Transcription terminée (Copié !)")
-        else:
-            self._home_page.set_transcription_result(False, f"Erreur: {text}")
+            # QClipboard must be used from the GUI thread
+            self._copy_to_clipboard(text)
+            self._history_page.invalidate()
+            if self._cfg_auto_paste:
+                threading.Thread(target=self._auto_paste, args=(text,), daemon=True).start()
+        
+        message = self._STATUS_MESSAGES.get(status)
+        if message is None:
+            message = "Erreur: " + text
+        self._home_page.set_transcription_result(success, message)
         
         # Reset status after 3 seconds
         QTimer.singleShot(3000, self._reset_transcription_status)
@@ -319,10 +466,11 @@ class MainWindow(QMainWindow):
     
     def _copy_to_clipboard(self, text: str) -> None:
         """Copy text to clipboard and show feedback."""
-        try:
-            pyperclip.copy(text)
-        except Exception as e:
-            print(f"[Clipboard] Error: {e}")
+        clipboard = QApplication.clipboard()
+        if clipboard is None:
+            print("[Clipboard] Error: no clipboard available")
+            return
+        clipboard.setText(text)
     
     # === Notifications ===
     
@@ -337,30 +485,100 @@ class MainWindow(QMainWindow):
     
     # === Sound ===
     
+    def _setup_sound(self) -> None:
+        """Load the feedback sound once so each play skips decoding."""
+        self._sound_path = SOUND_FILE if SOUND_FILE.exists() else self._create_beep_file()
+        if self._sound_path is None:
+            return
+        
+        try:
+            from PyQt6.QtCore import QUrl
+            from PyQt6.QtMultimedia import QSoundEffect
+            
+            self._sound_effect = QSoundEffect(self)
+            self._sound_effect.setSource(QUrl.fromLocalFile(str(self._sound_path)))
+        except Exception as e:
+            print(f"[Sound] Error loading {self._sound_path.name}: {e}")
+            self._sound_effect = None
+    
+    @staticmethod
+    def _create_beep_file() -> Optional[Path]:
+        """
+        Write a short 800 Hz beep to BEEP_FILE, once.
+        
+        Returns:
+            Path to the beep, or None if it could not be written
+        """
+        if BEEP_FILE.exists():
+            return BEEP_FILE
+        
+        try:
+            rate = 44100
+            t = np.arange(int(rate * 0.1)) / rate  # 100 ms
+            envelope = np.minimum(1.0, np.minimum(t, t[-1] - t) / 0.005)  # 5 ms fades, no clicks
+            tone = (0.3 * 32767 * envelope * np.sin(2 * np.pi * 800 * t)).astype(np.int16)
+            
+            with wave.open(str(BEEP_FILE), "wb") as wf:
+                wf.setnchannels(1)
+                wf.setsampwidth(2)
+                wf.setframerate(rate)
+                wf.writeframes(tone.tobytes())
+            return BEEP_FILE
+        except Exception as e:
+            print(f"[Sound] Error creating {BEEP_FILE.name}: {e}")
+            return None
+    
     def _play_sound(self) -> None:
         """Play feedback sound."""
-        if not settings.get("sound_enabled", True):
+        if not self._cfg_sound_enabled:
+            return
+        
+        if self._sound_effect is not None:
+            self._sound_effect.play()
             return
         
-        # Simple beep for now
+        # QtMultimedia unavailable: let Windows play the file asynchronously
+        if winsound is None or self._sound_path is None:
+            return
         try:
-            import winsound
-            winsound.Beep(800, 100)
+            winsound.PlaySound(
+                str(self._sound_path),
+                winsound.SND_FILENAME | winsound.SND_ASYNC | winsound.SND_NODEFAULT
+            )
         except Exception:
             pass
     
     # === Settings ===
     
+    def _load_cached_settings(self) -> None:
+        """Snapshot the settings read on every recording."""
+        snapshot = settings.snapshot
+        self._cfg_sound_enabled = snapshot.sound_enabled
+        self._cfg_auto_paste = snapshot.auto_paste
+        self._cfg_language = snapshot.language
+        self._cfg_use_online = snapshot.use_online
+        self._cfg_parallel = snapshot.parallel_transcribe
+        self._cfg_silence_enabled = snapshot.silence_detection_enabled
+        self._cfg_silence_seconds = snapshot.silence_threshold_seconds
+    
     def _on_settings_changed(self) -> None:
         """Handle settings change."""
+        self._load_cached_settings()
+        
+        # The parallel race only runs once the local model is loaded
+        if (self._cfg_use_online and self._cfg_parallel
+                and not whisper_transcriber.is_available()
+                and not whisper_transcriber.is_loading()):
+            whisper_transcriber.load_async()
+        
         # Update audio device
-        mic_index = settings.get("mic_index")
+        mic_index = settings.snapshot.mic_index
         if self._audio_recorder:
             self._audio_recorder.set_device(mic_index)
     
     def _on_hotkey_changed(self, new_hotkey: str) -> None:
         """Handle hotkey change."""
-        old_hotkey = settings.get("hotkey", "F8")
+        old_hotkey = settings.snapshot.hotkey
         
         hotkey_manager.update_hotkey(
             old_hotkey, 
@@ -375,19 +593,15 @@ class MainWindow(QMainWindow):
     def showEvent(self, event) -> None:
         """Handle window show - restart animations."""
         super().showEvent(event)
-        # Use QTimer.singleShot to ensure we're in the main thread
-        QTimer.singleShot(0, self._restart_animations)
-    
-    def _restart_animations(self) -> None:
-        """Restart animations (called from main thread)."""
-        try:
-            self._home_page._waveform.start()
-            self._home_page._mic_button._pulse_timer.start(30)
-        except Exception:
-            pass
-        # Force repaint
-        self.repaint()
-        self.update()
+        # Show events arrive on the GUI thread, and Qt already schedules
+        # the paint of a newly shown window
+        # Only the home page animates; other pages keep its timers idle
+        if self._stack.currentWidget() is self._home_page:
+            try:
+                self._home_page._waveform.start()
+                self._home_page._mic_button.start()
+            except Exception:
+                pass
     
     def hideEvent(self, event) -> None:
         """Handle window hide - pause animations to save CPU."""
@@ -395,28 +609,31 @@ class MainWindow(QMainWindow):
         # Stop animations to save resources
         try:
             self._home_page._waveform.stop()
-            self._home_page._mic_button._pulse_timer.stop()
+            self._home_page._mic_button.stop()
         except Exception:
             pass
     
     def closeEvent(self, event) -> None:
         """Handle window close - hide to tray instead of quitting."""
         # Hide window instead of closing
+        settings.flush()
         self.hide()
         event.ignore()  # Don't actually close
     
     def force_quit(self) -> None:
         """Force quit the application (called from tray menu)."""
-        # Stop recording if active
-        if self._is_recording and self._audio_recorder:
-            self._audio_recorder.stop()
+        # Stop recording if active and release the microphone
+        if self._audio_recorder:
+            self._audio_recorder.close()
         
         # Unregister hotkeys
         hotkey_manager.unregister_all()
         
+        # Write any debounced settings changes
+        settings.flush()
+        
         # Cleanup pages
         self._home_page.cleanup()
         
         # Accept close
-        from PyQt6.QtWidgets import QApplication
         QApplication.quit()
@@ -2,7 +2,8 @@
 V2T 2.1 - History Page
 Displays saved transcriptions.
 """
-from typing import Optional, List
+import threading
+from typing import Dict, Optional, List
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
@@ -12,13 +13,11 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QFont, QCursor
 
-from src.utils.constants import Colors
-from src.ui.widgets.transcript_card import TranscriptCard
+from src.utils.constants import Colors, UIConfig
+from src.ui.widgets.transcript_card import TranscriptCard, CARD_STYLESHEET
 from src.services.storage import storage, Transcript
 from src.core.groq_transcriber import groq_transcriber
 
-import pyperclip
-
 
 class HistoryPage(QWidget):
     """
@@ -36,11 +35,23 @@ class HistoryPage(QWidget):
     navigate_back = pyqtSignal()
     text_copied = pyqtSignal(str)
     notification_requested = pyqtSignal(str, str)  # title, message
+    _transcripts_loaded = pyqtSignal(int, object)  # load generation, transcripts (from thread)
+    _history_cleared = pyqtSignal(int)  # Rows deleted (from thread)
+    _history_clear_failed = pyqtSignal(str)  # Error message (from thread)
     
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         
-        self._cards: List[TranscriptCard] = []
+        self._cards: Dict[int, TranscriptCard] = {}  # Mounted cards by transcript ID, in order
+        self._card_pool: List[TranscriptCard] = []  # Hidden cards kept for reuse
+        self._pending: List[Transcript] = []  # Loaded but not yet mounted
+        self._load_generation = 0  # Only the latest load is displayed
+        self._confirm_box: Optional[QMessageBox] = None  # Built on first delete, then reused
+        self._dirty = True  # Storage changed since the last load: reload when shown
+        self._last_needle = ""  # Search applied to the mounted cards
+        self._transcripts_loaded.connect(self._on_transcripts_loaded)
+        self._history_cleared.connect(self._on_history_cleared)
+        self._history_clear_failed.connect(self._on_history_clear_failed)
         self._setup_ui()
     
     def _setup_ui(self) -> None:
@@ -119,7 +130,14 @@ class HistoryPage(QWidget):
                 border-color: {Colors.ACCENT_PRIMARY};
             }}
         """)
-        self._search_input.textChanged.connect(self._filter_transcripts)
+        # Filter once typing pauses rather than on every keystroke
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(UIConfig.SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(
+            lambda: self._filter_transcripts(self._search_input.text())
+        )
+        self._search_input.textChanged.connect(self._search_timer.start)
         layout.addWidget(self._search_input)
         
         # ===== Count Label =====
@@ -130,6 +148,7 @@ class HistoryPage(QWidget):
         
         # ===== Scroll Area for Cards =====
         scroll = QScrollArea()
+        self._scroll = scroll
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         scroll.setStyleSheet(f"""
@@ -141,6 +160,7 @@ class HistoryPage(QWidget):
         
         # Container for cards
         self._cards_container = QWidget()
+        self._cards_container.setStyleSheet(CARD_STYLESHEET)  # Shared by every card
         self._cards_layout = QVBoxLayout(self._cards_container)
         self._cards_layout.setContentsMargins(0, 0, 0, 0)
         self._cards_layout.setSpacing(12)
@@ -149,6 +169,10 @@ class HistoryPage(QWidget):
         scroll.setWidget(self._cards_container)
         layout.addWidget(scroll, 1)
         
+        # Mount more cards when scrolling near the end (or when they don't fill the view)
+        scroll.verticalScrollBar().valueChanged.connect(self._maybe_mount_more)
+        scroll.verticalScrollBar().rangeChanged.connect(self._maybe_mount_more)
+        
         # ===== Empty State =====
         self._empty_label = QLabel("Aucune transcription sauvegardée")
         self._empty_label.setFont(QFont("Segoe UI", 14))
@@ -157,14 +181,42 @@ class HistoryPage(QWidget):
         self._empty_label.hide()
         layout.addWidget(self._empty_label)
     
+    def showEvent(self, event) -> None:
+        """Reload the list on show if storage changed while hidden."""
+        super().showEvent(event)
+        if self._dirty:
+            self.load_transcripts()
+    
+    def invalidate(self) -> None:
+        """Mark the list stale; it reloads the next time the page is shown."""
+        self._dirty = True
+        if self.isVisible():
+            self.load_transcripts()
+    
     def load_transcripts(self) -> None:
-        """Load and display all transcripts."""
+        """Load all transcripts in the background, then display them."""
+        self._dirty = False
+        self._load_generation += 1
+        generation = self._load_generation
+        
+        def fetch():
+            try:
+                transcripts = storage.get_all(limit=100)
+            except Exception as e:
+                print(f"[HistoryPage] Error loading transcripts: {e}")
+                return
+            self._transcripts_loaded.emit(generation, transcripts)
+        
+        threading.Thread(target=fetch, daemon=True).start()
+    
+    def _on_transcripts_loaded(self, generation: int, transcripts: List[Transcript]) -> None:
+        """Display fetched transcripts (main thread)."""
+        if generation != self._load_generation:
+            return  # A newer load is on its way
+        
         # Clear existing cards
         self._clear_cards()
         
-        # Get transcripts from storage
-        transcripts = storage.get_all(limit=100)
-        
         # Update count
         count = len(transcripts)
         self._count_label.setText(f"{count} transcription{'s' if count != 1 else ''}")
@@ -175,63 +227,109 @@ class HistoryPage(QWidget):
         
         self._empty_label.hide()
         
-        # Create cards
-        for transcript in transcripts:
-            card = TranscriptCard(
-                transcript_id=transcript.id,
-                title=transcript.title,
-                text=transcript.text,
-                created_at=transcript.created_at,
-                duration=transcript.duration
-            )
-            
-            # Connect signals
-            card.copy_requested.connect(self._on_copy)
-            card.delete_requested.connect(self._on_delete)
-            card.correct_requested.connect(self._on_correct)
-            card.clicked.connect(self._on_card_clicked)
-            
-            # Insert before stretch
-            self._cards_layout.insertWidget(
-                self._cards_layout.count() - 1, 
-                card
+        # Only the first batch gets widgets now; the rest follows on scroll
+        self._pending = list(transcripts)
+        self._mount_next(UIConfig.HISTORY_BATCH_SIZE)
+        
+        # Keep an active search applied to the fresh list
+        if self._search_input.text().strip():
+            self._filter_transcripts(self._search_input.text())
+    
+    def _mount_next(self, limit: Optional[int] = None) -> None:
+        """Give cards to the next pending transcripts (all of them if no limit)."""
+        batch = self._pending if limit is None else self._pending[:limit]
+        if not batch:
+            return
+        self._pending = self._pending[len(batch):]
+        
+        # Fill cards, reusing pooled widgets before creating new ones
+        self._cards_container.setUpdatesEnabled(False)
+        try:
+            for transcript in batch:
+                card = self._acquire_card(transcript)
+                # Keep layout order in sync with the list order
+                self._cards_layout.removeWidget(card)
+                self._cards_layout.insertWidget(len(self._cards), card)
+                card.show()
+                self._cards[transcript.id] = card
+        finally:
+            self._cards_container.setUpdatesEnabled(True)
+    
+    def _maybe_mount_more(self, *_args) -> None:
+        """Mount the next batch once the view is close to the last card."""
+        if not self._pending or self._search_input.text().strip():
+            return
+        bar = self._scroll.verticalScrollBar()
+        if bar.maximum() - bar.value() <= UIConfig.HISTORY_PREFETCH_PX:
+            self._mount_next(UIConfig.HISTORY_BATCH_SIZE)
+    
+    def _total_count(self) -> int:
+        """Transcripts on the page, mounted or not."""
+        return len(self._cards) + len(self._pending)
+    
+    def _acquire_card(self, transcript: Transcript) -> TranscriptCard:
+        """Take a pooled card for a transcript, or create one."""
+        if self._card_pool:
+            card = self._card_pool.pop()
+            card.update_content(
+                transcript.id,
+                transcript.title,
+                transcript.text,
+                transcript.created_at,
+                transcript.duration
             )
-            self._cards.append(card)
+            return card
+        
+        card = TranscriptCard(
+            transcript_id=transcript.id,
+            title=transcript.title,
+            text=transcript.text,
+            created_at=transcript.created_at,
+            duration=transcript.duration
+        )
+        
+        # Connect signals (once per widget, kept across reuse)
+        card.copy_requested.connect(self._on_copy)
+        card.delete_requested.connect(self._on_delete)
+        card.correct_requested.connect(self._on_correct)
+        card.clicked.connect(self._on_card_clicked)
+        return card
+    
+    def _release_card(self, card: TranscriptCard) -> None:
+        """Hide a card and keep it for the next load."""
+        card.hide()
+        self._card_pool.append(card)
     
     def _clear_cards(self) -> None:
-        """Remove all card widgets."""
-        for card in self._cards:
-            card.deleteLater()
+        """Hide all card widgets and return them to the pool."""
+        for card in self._cards.values():
+            self._release_card(card)
         self._cards.clear()
+        self._pending = []
+        self._last_needle = ""
     
     def _on_copy(self, transcript_id: int) -> None:
         """Handle copy request from a card."""
-        transcript = storage.get_by_id(transcript_id)
-        if transcript:
-            self.text_copied.emit(transcript.text)
+        # The card already holds the text: no database round-trip
+        card = self._cards.get(transcript_id)
+        if card is not None:
+            self.text_copied.emit(card.text)
     
     def _on_delete(self, transcript_id: int) -> None:
         """Handle delete request from a card."""
         # Confirm deletion
-        reply = QMessageBox.question(
-            self,
+        if self._confirm(
             "Supprimer la transcription",
-            "Êtes-vous sûr de vouloir supprimer cette transcription ?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
-        )
-        
-        if reply == QMessageBox.StandardButton.Yes:
+            "Êtes-vous sûr de vouloir supprimer cette transcription ?"
+        ):
             if storage.delete(transcript_id):
                 # Remove card from UI
-                for card in self._cards:
-                    if card.transcript_id == transcript_id:
-                        card.deleteLater()
-                        self._cards.remove(card)
-                        break
+                card = self._cards.pop(transcript_id, None)
+                if card is not None:
+                    self._release_card(card)
                 
                 # Update count
-                count = len(self._cards)
+                count = self._total_count()
                 self._count_label.setText(
                     f"{count} transcription{'s' if count != 1 else ''}"
                 )
@@ -239,65 +337,89 @@ class HistoryPage(QWidget):
                 if count == 0:
                     self._empty_label.show()
     
+    def _confirm(self, title: str, message: str) -> bool:
+        """
+        Ask a Yes/No question (No by default) with a reused message box.
+        
+        Returns:
+            True if the user answered Yes
+        """
+        if self._confirm_box is None:
+            self._confirm_box = QMessageBox(self)
+            self._confirm_box.setIcon(QMessageBox.Icon.Question)
+            self._confirm_box.setStandardButtons(
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            )
+        
+        self._confirm_box.setWindowTitle(title)
+        self._confirm_box.setText(message)
+        self._confirm_box.setDefaultButton(QMessageBox.StandardButton.No)
+        self._confirm_box.exec()
+        clicked = self._confirm_box.standardButton(self._confirm_box.clickedButton())
+        return clicked == QMessageBox.StandardButton.Yes
+    
     def _on_delete_all(self) -> None:
         """Handle delete all button click."""
-        if len(self._cards) == 0:
+        total = self._total_count()
+        if total == 0:
             return
         
-        reply = QMessageBox.question(
-            self,
+        if self._confirm(
             "Supprimer tout l'historique",
-            f"Êtes-vous sûr de vouloir supprimer les {len(self._cards)} transcriptions ?\n\nCette action est irréversible.",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
-        )
-        
-        if reply == QMessageBox.StandardButton.Yes:
-            # Delete all from storage
-            deleted_count = storage.clear_all()
-            
-            # Clear UI
+            f"Êtes-vous sûr de vouloir supprimer les {total} transcriptions ?\n\nCette action est irréversible."
+        ):
+            # Clear UI now; a load already in flight must not bring cards back
+            self._load_generation += 1
             self._clear_cards()
             self._count_label.setText("0 transcriptions")
             self._empty_label.show()
             
-            # Show notification
-            self.notification_requested.emit(
-                "Historique supprimé",
-                f"{deleted_count} transcription(s) supprimée(s)"
-            )
+            # Deleting and compacting the file can take a while on big histories
+            def clear():
+                try:
+                    deleted_count = storage.clear_all()
+                except Exception as e:
+                    print(f"[HistoryPage] Error clearing history: {e}")
+                    self._history_clear_failed.emit(str(e))
+                    return
+                self._history_cleared.emit(deleted_count)
+            
+            threading.Thread(target=clear, daemon=True).start()
+    
+    def _on_history_cleared(self, deleted_count: int) -> None:
+        """Report a finished clear (main thread)."""
+        self.notification_requested.emit(
+            "Historique supprimé",
+            f"{deleted_count} transcription(s) supprimée(s)"
+        )
+    
+    def _on_history_clear_failed(self, error: str) -> None:
+        """Restore the list after a failed clear (main thread)."""
+        # The cards were removed up front: show what is actually still stored
+        self.invalidate()
+        self.notification_requested.emit(
+            "Erreur",
+            f"Impossible de supprimer l'historique: {error}"
+        )
 
     def _on_correct(self, transcript_id: int) -> None:
         """Handle correction request."""
-        transcript = storage.get_by_id(transcript_id)
-        if not transcript:
+        card = self._cards.get(transcript_id)
+        if card is None:
             return
+        text = card.text
         
-        # Find the card to update its button
-        card = None
-        for c in self._cards:
-            if c.transcript_id == transcript_id:
-                card = c
-                break
-            
         # Run in thread to avoid freezing UI
-        import threading
         def run_correction():
-            corrected_text = groq_transcriber.correct_grammar(transcript.text)
+            corrected_text = groq_transcriber.correct_grammar(text)
             if corrected_text:
-                # Copy to clipboard
-                try:
-                    pyperclip.copy(corrected_text)
-                except Exception:
-                    pass
-                
                 # Emit notification signal (thread-safe via Qt signals)
                 self.notification_requested.emit(
                     "Texte corrigé",
                     "Texte corrigé copié dans le presse-papier"
                 )
                 
-                # Also emit text_copied for legacy behavior
+                # MainWindow copies it to the clipboard (queued to the GUI thread)
                 self.text_copied.emit(corrected_text)
         
         threading.Thread(target=run_correction, daemon=True).start()
@@ -312,16 +434,35 @@ class HistoryPage(QWidget):
         
     def _filter_transcripts(self, text: str) -> None:
         """Filter visible cards based on search text."""
-        text = text.lower().strip()
-        visible_count = 0
+        if not self.isVisible():
+            # No layout work while hidden: the reload on show reapplies the search
+            self._dirty = True
+            return
+        
+        needle = text.casefold().strip()
+        visible_count = 0 if needle else len(self._pending)
+        if needle and self._pending:
+            # Searching covers every loaded transcript, not just the mounted ones
+            self._mount_next()
+            self._last_needle = ""  # The new cards have not been filtered yet
+        
+        # Typing extends the needle: cards hidden by its prefix stay hidden
+        narrowing = bool(self._last_needle) and needle.startswith(self._last_needle)
+        self._last_needle = needle
+        
+        # One relayout for the whole pass, and only touch cards that change
+        self._cards_container.setUpdatesEnabled(False)
+        try:
+            for card in self._cards.values():
+                if narrowing and card.isHidden():
+                    continue
+                should_show = not needle or needle in card.search_blob
+                if card.isHidden() == should_show:
+                    card.setVisible(should_show)
+                visible_count += should_show
+        finally:
+            self._cards_container.setUpdatesEnabled(True)
         
-        for card in self._cards:
-            if not text or text in card.text.lower() or text in card._title.lower():
-                card.show()
-                visible_count += 1
-            else:
-                card.hide()
-                
         # Update count label
         self._count_label.setText(f"{visible_count} transcription{'s' if visible_count != 1 else ''}")
         
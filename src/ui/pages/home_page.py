@@ -14,6 +14,43 @@ from PyQt6.QtGui import QFont, QCursor
 from src.utils.constants import Colors, UIConfig
 from src.ui.widgets.waveform import WaveformWidget
 from src.ui.widgets.mic_button import MicButton
+from src.ui.styles.theme import set_style_state
+
+
+# One sheet for the whole page, formatted once at import. The status color
+# follows the label's "state" property (see set_style_state).
+_PAGE_STYLE = f"""
+    QLabel#title {{
+        color: {Colors.TEXT_PRIMARY};
+    }}
+    QLabel#hotkey {{
+        color: {Colors.TEXT_MUTED};
+    }}
+    QLabel#status[state="idle"] {{
+        color: {Colors.TEXT_SECONDARY};
+    }}
+    QLabel#status[state="recording"],
+    QLabel#status[state="error"] {{
+        color: {Colors.ERROR};
+    }}
+    QLabel#status[state="transcribing"] {{
+        color: {Colors.ACCENT_PRIMARY};
+    }}
+    QLabel#status[state="success"] {{
+        color: {Colors.SUCCESS};
+    }}
+    QPushButton#navBtn {{
+        background-color: {Colors.BG_CARD};
+        color: {Colors.TEXT_PRIMARY};
+        border: 1px solid {Colors.BORDER_DEFAULT};
+        border-radius: 10px;
+        padding: 10px 20px;
+    }}
+    QPushButton#navBtn:hover {{
+        border-color: {Colors.ACCENT_PRIMARY};
+        color: {Colors.ACCENT_PRIMARY};
+    }}
+"""
 
 
 class HomePage(QWidget):
@@ -41,6 +78,15 @@ class HomePage(QWidget):
     
     def _setup_ui(self) -> None:
         """Setup the page layout."""
+        # Paint nothing until every widget is in, so the page lays out once
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_layout()
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _build_layout(self) -> None:
+        """Create the page widgets (called by _setup_ui)."""
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 30, 20, 20)
         layout.setSpacing(0)
@@ -51,7 +97,7 @@ class HomePage(QWidget):
         
         title = QLabel("Voice to Text")
         title.setFont(QFont("Segoe UI", 22, QFont.Weight.Bold))
-        title.setStyleSheet(f"color: {Colors.TEXT_PRIMARY};")
+        title.setObjectName("title")
         header.addWidget(title)
         
         layout.addLayout(header)
@@ -72,7 +118,8 @@ class HomePage(QWidget):
         # Status text
         self._status_label = QLabel("Appuyez pour enregistrer")
         self._status_label.setFont(QFont("Segoe UI", 12))
-        self._status_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY};")
+        self._status_label.setObjectName("status")
+        self._status_label.setProperty("state", "idle")
         self._status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addSpacing(20)
         layout.addWidget(self._status_label)
@@ -80,7 +127,7 @@ class HomePage(QWidget):
         # Hotkey hint
         self._hotkey_label = QLabel("ou appuyez sur F8")
         self._hotkey_label.setFont(QFont("Segoe UI", 10))
-        self._hotkey_label.setStyleSheet(f"color: {Colors.TEXT_MUTED};")
+        self._hotkey_label.setObjectName("hotkey")
         self._hotkey_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self._hotkey_label)
         
@@ -102,7 +149,7 @@ class HomePage(QWidget):
         self._settings_btn = QPushButton("⚙️ Paramètres")
         self._settings_btn.setFont(QFont("Segoe UI", 11))
         self._settings_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        self._settings_btn.setStyleSheet(self._get_nav_button_style())
+        self._settings_btn.setObjectName("navBtn")
         self._settings_btn.clicked.connect(self.navigate_settings.emit)
         nav_layout.addWidget(self._settings_btn)
         
@@ -113,27 +160,13 @@ class HomePage(QWidget):
         self._history_btn = QPushButton("📂 Historique")
         self._history_btn.setFont(QFont("Segoe UI", 11))
         self._history_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        self._history_btn.setStyleSheet(self._get_nav_button_style())
+        self._history_btn.setObjectName("navBtn")
         self._history_btn.clicked.connect(self.navigate_history.emit)
         nav_layout.addWidget(self._history_btn)
         
         layout.addLayout(nav_layout)
-    
-    def _get_nav_button_style(self) -> str:
-        """Get style for navigation buttons."""
-        return f"""
-            QPushButton {{
-                background-color: {Colors.BG_CARD};
-                color: {Colors.TEXT_PRIMARY};
-                border: 1px solid {Colors.BORDER_DEFAULT};
-                border-radius: 10px;
-                padding: 10px 20px;
-            }}
-            QPushButton:hover {{
-                border-color: {Colors.ACCENT_PRIMARY};
-                color: {Colors.ACCENT_PRIMARY};
-            }}
-        """
+        
+        self.setStyleSheet(_PAGE_STYLE)
     
     def _on_mic_click(self) -> None:
         """Handle microphone button click."""
@@ -151,12 +184,12 @@ class HomePage(QWidget):
         
         if recording:
             self._status_label.setText("Enregistrement en cours...")
-            self._status_label.setStyleSheet(f"color: {Colors.ERROR};")
+            set_style_state(self._status_label, "recording")
             self._hotkey_label.setText("Appuyez à nouveau pour arrêter")
         else:
             if not self._is_transcribing:
                 self._status_label.setText("Appuyez pour enregistrer")
-                self._status_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY};")
+                set_style_state(self._status_label, "idle")
                 self._hotkey_label.setText("ou appuyez sur F8")
     
     def set_transcribing(self, transcribing: bool) -> None:
@@ -165,12 +198,12 @@ class HomePage(QWidget):
         
         if transcribing:
             self._status_label.setText("Transcription en cours...")
-            self._status_label.setStyleSheet(f"color: {Colors.ACCENT_PRIMARY};")
+            set_style_state(self._status_label, "transcribing")
             self._hotkey_label.setText("Veuillez patienter")
             self._mic_button.setEnabled(False)
         else:
             self._status_label.setText("Appuyez pour enregistrer")
-            self._status_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY};")
+            set_style_state(self._status_label, "idle")
             self._hotkey_label.setText("ou appuyez sur F8")
             self._mic_button.setEnabled(True)
     
@@ -181,10 +214,10 @@ class HomePage(QWidget):
         
         if success:
             self._status_label.setText("Transcription terminée (Copié !) ✓")
-            self._status_label.setStyleSheet(f"color: {Colors.SUCCESS};")
+            set_style_state(self._status_label, "success")
         else:
             self._status_label.setText(message)
-            self._status_label.setStyleSheet(f"color: {Colors.ERROR};")
+            set_style_state(self._status_label, "error")
         
         self._hotkey_label.setText(f"ou appuyez sur {self._current_hotkey}")
     
@@ -205,6 +238,18 @@ class HomePage(QWidget):
     def is_recording(self) -> bool:
         return self._is_recording
     
+    def showEvent(self, event) -> None:
+        """Resume animations when the page becomes visible."""
+        super().showEvent(event)
+        self._waveform.start()
+        self._mic_button.start()
+    
+    def hideEvent(self, event) -> None:
+        """Pause animations while another page (or the tray) is shown."""
+        super().hideEvent(event)
+        self._waveform.stop()
+        self._mic_button.stop()
+    
     def cleanup(self) -> None:
         """Cleanup resources."""
         self._waveform.stop()
@@ -4,20 +4,20 @@ Configuration options for the application.
 """
 import threading
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QComboBox,
     QLineEdit, QCheckBox, QFrame, QSlider, QProgressBar
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QTimer
 from PyQt6.QtGui import QFont, QCursor
 
 from src.utils.constants import Colors, TranscriptionConfig
 from src.services.settings import settings
-from src.core.audio_recorder import AudioRecorder
 from src.core.hotkey_manager import hotkey_manager
+from src.ui.styles.theme import set_style_state
 
 
 # Whisper model configurations
@@ -29,6 +29,178 @@ WHISPER_MODELS = {
     "large-v3": {"label": "Large (Très précis)", "size": "~3 GB"},
 }
 
+# One sheet for the whole page, formatted once at import. Widgets are
+# matched by object name; looks that change at runtime are switched through
+# the "state" property (see set_style_state).
+_PAGE_STYLE = f"""
+    QPushButton#backBtn {{
+        background-color: transparent;
+        color: {Colors.TEXT_SECONDARY};
+        border: none;
+        padding: 6px 10px;
+    }}
+    QPushButton#backBtn:hover {{
+        color: {Colors.ACCENT_PRIMARY};
+    }}
+    QLabel#title {{
+        color: {Colors.TEXT_PRIMARY};
+    }}
+    QLabel#sectionLabel {{
+        color: {Colors.TEXT_SECONDARY};
+    }}
+    
+    QComboBox#comboBox {{
+        background-color: {Colors.BG_INPUT};
+        color: {Colors.TEXT_PRIMARY};
+        border: 1px solid {Colors.BORDER_DEFAULT};
+        border-radius: 6px;
+        padding: 8px 10px;
+        font-size: 12px;
+    }}
+    QComboBox#comboBox:hover {{
+        border-color: {Colors.ACCENT_PRIMARY};
+    }}
+    QComboBox#comboBox::drop-down {{
+        border: none;
+        width: 22px;
+    }}
+    QComboBox#comboBox QAbstractItemView {{
+        background-color: {Colors.BG_CARD};
+        color: {Colors.TEXT_PRIMARY};
+        border: 1px solid {Colors.BORDER_DEFAULT};
+        selection-background-color: {Colors.ACCENT_PRIMARY};
+        padding: 3px;
+    }}
+    QComboBox#comboBox QAbstractItemView::item {{
+        padding: 5px 8px;
+        min-height: 18px;
+    }}
+    
+    QLineEdit#apiInput {{
+        background-color: {Colors.BG_INPUT};
+        color: {Colors.TEXT_PRIMARY};
+        border: 1px solid {Colors.BORDER_DEFAULT};
+        border-radius: 6px;
+        padding: 8px 10px;
+        font-size: 12px;
+    }}
+    QLineEdit#apiInput:focus {{
+        border-color: {Colors.ACCENT_PRIMARY};
+    }}
+    
+    QPushButton#actionBtn {{
+        background-color: {Colors.BG_CARD};
+        color: {Colors.TEXT_PRIMARY};
+        border: 1px solid {Colors.BORDER_DEFAULT};
+        border-radius: 6px;
+        padding: 8px 12px;
+        font-size: 12px;
+    }}
+    QPushButton#actionBtn:hover {{
+        border-color: {Colors.ACCENT_PRIMARY};
+    }}
+    QPushButton#actionBtn:disabled {{
+        opacity: 0.5;
+    }}
+    QPushButton#actionBtn[state="success"] {{
+        background-color: {Colors.SUCCESS};
+    }}
+    QPushButton#actionBtn[state="installed"] {{
+        background-color: {Colors.SUCCESS};
+        color: white;
+        border: none;
+    }}
+    QPushButton#actionBtn[state="installed"]:hover {{
+        background-color: {Colors.ERROR};
+    }}
+    QPushButton#actionBtn[state="downloading"] {{
+        background-color: {Colors.WARNING};
+        color: {Colors.BG_DARK};
+        border: none;
+    }}
+    
+    QPushButton#hotkeyBtn {{
+        background-color: {Colors.ACCENT_PRIMARY};
+        color: {Colors.BG_DARK};
+        border: none;
+        border-radius: 6px;
+        padding: 8px 15px;
+        font-size: 12px;
+        font-weight: 600;
+    }}
+    QPushButton#hotkeyBtn:hover {{
+        background-color: {Colors.ACCENT_SECONDARY};
+    }}
+    QPushButton#hotkeyBtn[state="capturing"],
+    QPushButton#hotkeyBtn[state="capturing"]:hover {{
+        background-color: {Colors.WARNING};
+    }}
+    
+    QLabel#modelStatus, QLabel#progressLabel {{
+        color: {Colors.TEXT_MUTED};
+    }}
+    QLabel#modelStatus[state="success"] {{
+        color: {Colors.SUCCESS};
+    }}
+    QLabel#modelStatus[state="warning"] {{
+        color: {Colors.WARNING};
+    }}
+    QLabel#modelStatus[state="error"] {{
+        color: {Colors.ERROR};
+    }}
+    QProgressBar#downloadProgress {{
+        background-color: {Colors.BG_INPUT};
+        border: none;
+        border-radius: 4px;
+        height: 8px;
+    }}
+    QProgressBar#downloadProgress::chunk {{
+        background-color: {Colors.ACCENT_PRIMARY};
+        border-radius: 4px;
+    }}
+    
+    QCheckBox#toggle {{
+        font-size: 12px;
+        spacing: 8px;
+        padding: 3px 0;
+    }}
+    QCheckBox#toggle::indicator {{
+        width: 32px;
+        height: 18px;
+        border-radius: 9px;
+        border: none;
+    }}
+    QCheckBox#toggle[state="on"] {{
+        color: {Colors.TEXT_PRIMARY};
+    }}
+    QCheckBox#toggle[state="on"]::indicator {{
+        background-color: {Colors.SUCCESS};
+    }}
+    QCheckBox#toggle[state="off"] {{
+        color: {Colors.TEXT_MUTED};
+    }}
+    QCheckBox#toggle[state="off"]::indicator {{
+        background-color: {Colors.ERROR};
+    }}
+    
+    QLabel#silenceLabel {{
+        color: {Colors.TEXT_SECONDARY};
+        font-size: 11px;
+    }}
+    QSlider#silenceSlider::groove:horizontal {{
+        background: {Colors.BG_INPUT};
+        height: 6px;
+        border-radius: 3px;
+    }}
+    QSlider#silenceSlider::handle:horizontal {{
+        background: {Colors.ACCENT_PRIMARY};
+        width: 14px;
+        height: 14px;
+        margin: -4px 0;
+        border-radius: 7px;
+    }}
+"""
+
 
 class SettingsPage(QWidget):
     """
@@ -41,6 +213,7 @@ class SettingsPage(QWidget):
     - Online/Offline mode toggle
     - Whisper model selection (offline mode)
     - Sound effects toggle
+    - Parallel Groq + local transcription toggle
     - Auto-stop on silence
     """
     
@@ -58,18 +231,37 @@ class SettingsPage(QWidget):
         self._capturing_hotkey = False
         self._downloading_model = False
         self._model_installed = False
-        self._setup_ui()
+        self._built = False  # Widgets are created on first show
         self._connect_signals()
-        self._load_current_settings()
+    
+    def showEvent(self, event) -> None:
+        """Build the page the first time it is shown."""
+        if not self._built:
+            self._setup_ui()
+            self._load_current_settings()
+            self._built = True
+        super().showEvent(event)
     
     def _connect_signals(self) -> None:
         """Connect internal signals."""
         self._progress_updated.connect(self._on_progress_update)
         self._progress_text_updated.connect(self._on_progress_text_update)
-        self._hotkey_display_updated.connect(self._update_hotkey_display)
+        # Emitted by the capture thread, always delivered on the GUI thread
+        self._hotkey_display_updated.connect(
+            self._update_hotkey_display, Qt.ConnectionType.QueuedConnection
+        )
     
     def _setup_ui(self) -> None:
         """Setup the page layout."""
+        # Paint nothing until every widget is in, so the page lays out once
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_layout()
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _build_layout(self) -> None:
+        """Create the page widgets (called by _setup_ui)."""
         layout = QVBoxLayout(self)
         layout.setContentsMargins(15, 15, 15, 15)
         layout.setSpacing(8)
@@ -81,17 +273,7 @@ class SettingsPage(QWidget):
         self._back_btn = QPushButton("← Retour")
         self._back_btn.setFont(QFont("Segoe UI", 10))
         self._back_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        self._back_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {Colors.TEXT_SECONDARY};
-                border: none;
-                padding: 6px 10px;
-            }}
-            QPushButton:hover {{
-                color: {Colors.ACCENT_PRIMARY};
-            }}
-        """)
+        self._back_btn.setObjectName("backBtn")
         self._back_btn.clicked.connect(self.navigate_back.emit)
         header.addWidget(self._back_btn)
         
@@ -99,7 +281,7 @@ class SettingsPage(QWidget):
         
         title = QLabel("Paramètres")
         title.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
-        title.setStyleSheet(f"color: {Colors.TEXT_PRIMARY};")
+        title.setObjectName("title")
         header.addWidget(title)
         
         header.addStretch()
@@ -113,17 +295,33 @@ class SettingsPage(QWidget):
         # --- Microphone ---
         layout.addWidget(self._create_section_label("Microphone"))
         
+        mic_layout = QHBoxLayout()
+        mic_layout.setSpacing(8)
+        mic_layout.setContentsMargins(0, 0, 0, 0)
+        
         self._mic_combo = QComboBox()
-        self._mic_combo.setStyleSheet(self._get_combo_style())
+        self._mic_combo.setObjectName("comboBox")
         self._mic_combo.currentIndexChanged.connect(self._on_mic_changed)
-        layout.addWidget(self._mic_combo)
+        mic_layout.addWidget(self._mic_combo, 1)
+        
+        self._mic_refresh_btn = QPushButton("⟳")
+        self._mic_refresh_btn.setFixedWidth(50)
+        self._mic_refresh_btn.setToolTip("Actualiser la liste des micros")
+        self._mic_refresh_btn.setObjectName("actionBtn")
+        self._mic_refresh_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self._mic_refresh_btn.clicked.connect(self._on_mic_refresh)
+        mic_layout.addWidget(self._mic_refresh_btn)
+        
+        layout.addLayout(mic_layout)
         
         # --- Language ---
         layout.addWidget(self._create_section_label("Langue"))
         
         self._lang_combo = QComboBox()
-        self._lang_combo.setStyleSheet(self._get_combo_style())
-        for name, code in TranscriptionConfig.LANGUAGES.items():
+        self._lang_combo.setObjectName("comboBox")
+        self._lang_index_by_code: Dict[str, int] = {}
+        for index, (name, code) in enumerate(TranscriptionConfig.LANGUAGES.items()):
+            self._lang_index_by_code[code] = index
             self._lang_combo.addItem(name, code)
         self._lang_combo.currentIndexChanged.connect(self._on_lang_changed)
         layout.addWidget(self._lang_combo)
@@ -138,12 +336,12 @@ class SettingsPage(QWidget):
         self._api_input = QLineEdit()
         self._api_input.setEchoMode(QLineEdit.EchoMode.Password)
         self._api_input.setPlaceholderText("gsk_xxx...")
-        self._api_input.setStyleSheet(self._get_input_style())
+        self._api_input.setObjectName("apiInput")
         api_layout.addWidget(self._api_input, 1)
         
         self._api_save_btn = QPushButton("OK")
         self._api_save_btn.setFixedWidth(50)
-        self._api_save_btn.setStyleSheet(self._get_button_style())
+        self._api_save_btn.setObjectName("actionBtn")
         self._api_save_btn.clicked.connect(self._on_api_save)
         api_layout.addWidget(self._api_save_btn)
         
@@ -162,20 +360,8 @@ class SettingsPage(QWidget):
         layout.addWidget(self._create_section_label("Raccourci clavier"))
         
         self._hotkey_btn = QPushButton("F8")
-        self._hotkey_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {Colors.ACCENT_PRIMARY};
-                color: {Colors.BG_DARK};
-                border: none;
-                border-radius: 6px;
-                padding: 8px 15px;
-                font-size: 12px;
-                font-weight: 600;
-            }}
-            QPushButton:hover {{
-                background-color: {Colors.ACCENT_SECONDARY};
-            }}
-        """)
+        self._hotkey_btn.setObjectName("hotkeyBtn")
+        self._hotkey_btn.setProperty("state", "idle")
         self._hotkey_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self._hotkey_btn.clicked.connect(self._on_hotkey_capture)
         layout.addWidget(self._hotkey_btn)
@@ -184,7 +370,7 @@ class SettingsPage(QWidget):
         layout.addWidget(self._create_section_label("Mode de transcription"))
         
         self._mode_combo = QComboBox()
-        self._mode_combo.setStyleSheet(self._get_combo_style())
+        self._mode_combo.setObjectName("comboBox")
         self._mode_combo.addItem("Online (Groq API)", True)
         self._mode_combo.addItem("Offline (Whisper local)", False)
         self._mode_combo.currentIndexChanged.connect(self._on_mode_changed)
@@ -201,14 +387,16 @@ class SettingsPage(QWidget):
         model_row.setSpacing(8)
         
         self._model_combo = QComboBox()
-        self._model_combo.setStyleSheet(self._get_combo_style())
-        for model_id, info in WHISPER_MODELS.items():
+        self._model_combo.setObjectName("comboBox")
+        self._model_index_by_id: Dict[str, int] = {}
+        for index, (model_id, info) in enumerate(WHISPER_MODELS.items()):
+            self._model_index_by_id[model_id] = index
             self._model_combo.addItem(f"{info['label']} ({info['size']})", model_id)
         self._model_combo.currentIndexChanged.connect(self._on_model_changed)
         model_row.addWidget(self._model_combo, 1)
         
         self._download_btn = QPushButton("📥 Télécharger")
-        self._download_btn.setStyleSheet(self._get_button_style())
+        self._download_btn.setObjectName("actionBtn")
         self._download_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self._download_btn.clicked.connect(self._on_download_model)
         self._download_btn.enterEvent = lambda e: self._on_download_btn_hover(True)
@@ -220,7 +408,7 @@ class SettingsPage(QWidget):
         # Model status label
         self._model_status = QLabel("⏳ Vérification...")
         self._model_status.setFont(QFont("Segoe UI", 10))
-        self._model_status.setStyleSheet(f"color: {Colors.TEXT_MUTED};")
+        self._model_status.setObjectName("modelStatus")
         whisper_layout.addWidget(self._model_status)
         
         # Download progress bar (hidden by default)
@@ -228,25 +416,14 @@ class SettingsPage(QWidget):
         self._download_progress.setRange(0, 100)
         self._download_progress.setValue(0)
         self._download_progress.setTextVisible(False)
-        self._download_progress.setStyleSheet(f"""
-            QProgressBar {{
-                background-color: {Colors.BG_INPUT};
-                border: none;
-                border-radius: 4px;
-                height: 8px;
-            }}
-            QProgressBar::chunk {{
-                background-color: {Colors.ACCENT_PRIMARY};
-                border-radius: 4px;
-            }}
-        """)
+        self._download_progress.setObjectName("downloadProgress")
         self._download_progress.hide()
         whisper_layout.addWidget(self._download_progress)
         
         # Progress percentage label
         self._progress_label = QLabel("")
         self._progress_label.setFont(QFont("Segoe UI", 9))
-        self._progress_label.setStyleSheet(f"color: {Colors.TEXT_MUTED};")
+        self._progress_label.setObjectName("progressLabel")
         self._progress_label.hide()
         whisper_layout.addWidget(self._progress_label)
         
@@ -258,16 +435,28 @@ class SettingsPage(QWidget):
         
         # Auto paste toggle
         self._auto_paste_check = QCheckBox("Coller automatiquement")
+        self._auto_paste_check.setObjectName("toggle")
         self._auto_paste_check.stateChanged.connect(self._on_auto_paste_changed)
         layout.addWidget(self._auto_paste_check)
         
         # Sound toggle
         self._sound_check = QCheckBox("Effets sonores")
+        self._sound_check.setObjectName("toggle")
         self._sound_check.stateChanged.connect(self._on_sound_changed)
         layout.addWidget(self._sound_check)
+        
+        # Parallel transcription toggle (online mode races the local model)
+        self._parallel_check = QCheckBox("Groq + Whisper local en parallèle")
+        self._parallel_check.setObjectName("toggle")
+        self._parallel_check.setToolTip(
+            "Lance aussi le modèle local et garde le premier résultat"
+        )
+        self._parallel_check.stateChanged.connect(self._on_parallel_changed)
+        layout.addWidget(self._parallel_check)
 
         # Silence Detection toggle
         self._silence_check = QCheckBox("Arrêt auto (silence)")
+        self._silence_check.setObjectName("toggle")
         self._silence_check.stateChanged.connect(self._on_silence_changed)
         layout.addWidget(self._silence_check)
 
@@ -279,7 +468,7 @@ class SettingsPage(QWidget):
 
         # Label for slider value
         self._silence_label = QLabel("Durée: 3 secondes")
-        self._silence_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY}; font-size: 11px;")
+        self._silence_label.setObjectName("silenceLabel")
         silence_layout.addWidget(self._silence_label)
 
         # Slider
@@ -287,20 +476,7 @@ class SettingsPage(QWidget):
         self._silence_slider.setMinimum(2)
         self._silence_slider.setMaximum(15)
         self._silence_slider.setValue(3)
-        self._silence_slider.setStyleSheet(f"""
-            QSlider::groove:horizontal {{
-                background: {Colors.BG_INPUT};
-                height: 6px;
-                border-radius: 3px;
-            }}
-            QSlider::handle:horizontal {{
-                background: {Colors.ACCENT_PRIMARY};
-                width: 14px;
-                height: 14px;
-                margin: -4px 0;
-                border-radius: 7px;
-            }}
-        """)
+        self._silence_slider.setObjectName("silenceSlider")
         self._silence_slider.valueChanged.connect(self._on_silence_slider_changed)
         silence_layout.addWidget(self._silence_slider)
 
@@ -308,134 +484,44 @@ class SettingsPage(QWidget):
         
         # Add stretch to push everything up
         layout.addStretch()
+        
+        self.setStyleSheet(_PAGE_STYLE)
     
     def _create_section_label(self, text: str) -> QLabel:
         """Create a section label."""
         label = QLabel(text)
         label.setFont(QFont("Segoe UI", 10))
-        label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY};")
+        label.setObjectName("sectionLabel")
         return label
     
-    def _get_combo_style(self) -> str:
-        return f"""
-            QComboBox {{
-                background-color: {Colors.BG_INPUT};
-                color: {Colors.TEXT_PRIMARY};
-                border: 1px solid {Colors.BORDER_DEFAULT};
-                border-radius: 6px;
-                padding: 8px 10px;
-                font-size: 12px;
-            }}
-            QComboBox:hover {{
-                border-color: {Colors.ACCENT_PRIMARY};
-            }}
-            QComboBox::drop-down {{
-                border: none;
-                width: 22px;
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: {Colors.BG_CARD};
-                color: {Colors.TEXT_PRIMARY};
-                border: 1px solid {Colors.BORDER_DEFAULT};
-                selection-background-color: {Colors.ACCENT_PRIMARY};
-                padding: 3px;
-            }}
-            QComboBox QAbstractItemView::item {{
-                padding: 5px 8px;
-                min-height: 18px;
-            }}
-        """
-    
-    def _get_input_style(self) -> str:
-        return f"""
-            QLineEdit {{
-                background-color: {Colors.BG_INPUT};
-                color: {Colors.TEXT_PRIMARY};
-                border: 1px solid {Colors.BORDER_DEFAULT};
-                border-radius: 6px;
-                padding: 8px 10px;
-                font-size: 12px;
-            }}
-            QLineEdit:focus {{
-                border-color: {Colors.ACCENT_PRIMARY};
-            }}
-        """
-    
-    def _get_button_style(self) -> str:
-        return f"""
-            QPushButton {{
-                background-color: {Colors.BG_CARD};
-                color: {Colors.TEXT_PRIMARY};
-                border: 1px solid {Colors.BORDER_DEFAULT};
-                border-radius: 6px;
-                padding: 8px 12px;
-                font-size: 12px;
-            }}
-            QPushButton:hover {{
-                border-color: {Colors.ACCENT_PRIMARY};
-            }}
-            QPushButton:disabled {{
-                opacity: 0.5;
-            }}
-        """
-    
-    def _get_checkbox_style_on(self) -> str:
-        return f"""
-            QCheckBox {{
-                color: {Colors.TEXT_PRIMARY};
-                font-size: 12px;
-                spacing: 8px;
-                padding: 3px 0;
-            }}
-            QCheckBox::indicator {{
-                width: 32px;
-                height: 18px;
-                border-radius: 9px;
-                border: none;
-                background-color: {Colors.SUCCESS};
-            }}
-        """
-    
-    def _get_checkbox_style_off(self) -> str:
-        return f"""
-            QCheckBox {{
-                color: {Colors.TEXT_MUTED};
-                font-size: 12px;
-                spacing: 8px;
-                padding: 3px 0;
-            }}
-            QCheckBox::indicator {{
-                width: 32px;
-                height: 18px;
-                border-radius: 9px;
-                border: none;
-                background-color: {Colors.ERROR};
-            }}
-        """
-    
     def _load_current_settings(self) -> None:
         """Load and display current settings."""
+        # Showing the stored values must not run the change handlers, which
+        # would write every setting back and emit settings_changed each time
+        controls = (
+            self._lang_combo, self._mode_combo, self._model_combo,
+            self._auto_paste_check, self._sound_check, self._parallel_check,
+            self._silence_check,
+            self._silence_slider,
+        )
+        for control in controls:
+            control.blockSignals(True)
+        try:
+            self._show_current_settings()
+        finally:
+            for control in controls:
+                control.blockSignals(False)
+    
+    def _show_current_settings(self) -> None:
+        """Set every control from settings (signals blocked by the caller)."""
         # Microphones
-        self._mic_combo.clear()
-        self._mic_combo.addItem("Par défaut", None)
-        
-        devices = AudioRecorder.get_devices()
-        for device in devices:
-            self._mic_combo.addItem(device["name"], device["index"])
-        
-        current_mic = settings.get("mic_index")
-        if current_mic is not None:
-            for i in range(self._mic_combo.count()):
-                if self._mic_combo.itemData(i) == current_mic:
-                    self._mic_combo.setCurrentIndex(i)
-                    break
+        self._populate_microphones()
         
         # Language
         current_lang = settings.get("language", "fr")
-        for i in range(self._lang_combo.count()):
-            if self._lang_combo.itemData(i) == current_lang:
-                self._lang_combo.setCurrentIndex(i)
-                break
+        index = self._lang_index_by_code.get(current_lang)
+        if index is not None:
+            self._lang_combo.setCurrentIndex(index)
         
         # API Key
         from src.core.groq_transcriber import groq_transcriber
@@ -453,10 +539,9 @@ class SettingsPage(QWidget):
         
         # Whisper model
         current_model = settings.get("whisper_model", "base")
-        for i in range(self._model_combo.count()):
-            if self._model_combo.itemData(i) == current_model:
-                self._model_combo.setCurrentIndex(i)
-                break
+        index = self._model_index_by_id.get(current_model)
+        if index is not None:
+            self._model_combo.setCurrentIndex(index)
         self._update_model_status()
         
         # Toggles
@@ -467,6 +552,10 @@ class SettingsPage(QWidget):
         sound_enabled = settings.get("sound_enabled", True)
         self._sound_check.setChecked(sound_enabled)
         self._update_checkbox_style(self._sound_check, sound_enabled)
+        
+        parallel = settings.get("parallel_transcribe", False)
+        self._parallel_check.setChecked(parallel)
+        self._update_checkbox_style(self._parallel_check, parallel)
 
         # Silence settings
         silence_enabled = settings.get("silence_detection_enabled", False)
@@ -478,6 +567,35 @@ class SettingsPage(QWidget):
         self._silence_slider.setValue(silence_seconds)
         self._silence_label.setText(f"Durée: {silence_seconds} secondes")
     
+    def _populate_microphones(self, refresh: bool = False) -> None:
+        """Fill the microphone list and select the configured device."""
+        from src.core.audio_recorder import AudioRecorder
+        
+        current_mic = settings.get("mic_index")
+        
+        # Repopulating must not be mistaken for a user selection
+        self._mic_combo.blockSignals(True)
+        try:
+            self._mic_combo.clear()
+            self._mic_combo.addItem("Par défaut", None)
+            
+            devices = AudioRecorder.get_devices(refresh=refresh)
+            index_by_device: Dict[int, int] = {}
+            for index, device in enumerate(devices, start=1):  # After "Par défaut"
+                index_by_device[device["index"]] = index
+                self._mic_combo.addItem(device["name"], device["index"])
+            
+            if current_mic is not None:
+                index = index_by_device.get(current_mic)
+                if index is not None:
+                    self._mic_combo.setCurrentIndex(index)
+        finally:
+            self._mic_combo.blockSignals(False)
+    
+    def _on_mic_refresh(self) -> None:
+        """Rescan audio devices."""
+        self._populate_microphones(refresh=True)
+    
     def _on_mic_changed(self, index: int) -> None:
         mic_index = self._mic_combo.itemData(index)
         settings.set("mic_index", mic_index)
@@ -495,18 +613,14 @@ class SettingsPage(QWidget):
             groq_transcriber.set_api_key(api_key)
             
             self._api_save_btn.setText("✓")
-            self._api_save_btn.setStyleSheet(
-                self._get_button_style().replace(
-                    Colors.BG_CARD, Colors.SUCCESS
-                )
-            )
+            set_style_state(self._api_save_btn, "success")
             
             # Reset after delay
             QTimer.singleShot(1500, self._reset_api_button)
     
     def _reset_api_button(self) -> None:
         self._api_save_btn.setText("OK")
-        self._api_save_btn.setStyleSheet(self._get_button_style())
+        set_style_state(self._api_save_btn, "idle")
     
     def _on_hotkey_capture(self) -> None:
         if self._capturing_hotkey:
@@ -514,17 +628,7 @@ class SettingsPage(QWidget):
         
         self._capturing_hotkey = True
         self._hotkey_btn.setText("Appuyez...")
-        self._hotkey_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {Colors.WARNING};
-                color: {Colors.BG_DARK};
-                border: none;
-                border-radius: 6px;
-                padding: 8px 15px;
-                font-size: 12px;
-                font-weight: 600;
-            }}
-        """)
+        set_style_state(self._hotkey_btn, "capturing")
         
         # Capture hotkey in thread
         def capture():
@@ -533,31 +637,18 @@ class SettingsPage(QWidget):
                 if key:
                     settings.set("hotkey", key)
                     self.hotkey_changed.emit(key)
-                    
-                    # Update UI in main thread via signal
-                    self._hotkey_display_updated.emit()
             finally:
                 self._capturing_hotkey = False
+                # Update UI in main thread via signal (also restores it on timeout)
+                self._hotkey_display_updated.emit()
         
         threading.Thread(target=capture, daemon=True).start()
     
+    @pyqtSlot()
     def _update_hotkey_display(self) -> None:
         hotkey = settings.get("hotkey", "F8")
         self._hotkey_btn.setText(f"Touche: {hotkey}")
-        self._hotkey_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {Colors.ACCENT_PRIMARY};
-                color: {Colors.BG_DARK};
-                border: none;
-                border-radius: 6px;
-                padding: 8px 15px;
-                font-size: 12px;
-                font-weight: 600;
-            }}
-            QPushButton:hover {{
-                background-color: {Colors.ACCENT_SECONDARY};
-            }}
-        """)
+        set_style_state(self._hotkey_btn, "idle")
     
     def _on_mode_changed(self, index: int) -> None:
         use_online = self._mode_combo.itemData(index)
@@ -603,28 +694,16 @@ class SettingsPage(QWidget):
         
         if self._model_installed:
             self._model_status.setText(f"✅ Modèle installé")
-            self._model_status.setStyleSheet(f"color: {Colors.SUCCESS};")
+            set_style_state(self._model_status, "success")
             self._download_btn.setText("✓ Installé")
             self._download_btn.setEnabled(True)  # Keep enabled for uninstall on hover
-            self._download_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {Colors.SUCCESS};
-                    color: white;
-                    border: none;
-                    border-radius: 6px;
-                    padding: 8px 12px;
-                    font-size: 12px;
-                }}
-                QPushButton:hover {{
-                    background-color: {Colors.ERROR};
-                }}
-            """)
+            set_style_state(self._download_btn, "installed")
         else:
             self._model_status.setText(f"❌ Modèle non installé")
-            self._model_status.setStyleSheet(f"color: {Colors.ERROR};")
+            set_style_state(self._model_status, "error")
             self._download_btn.setText("📥 Télécharger")
             self._download_btn.setEnabled(True)
-            self._download_btn.setStyleSheet(self._get_button_style())
+            set_style_state(self._download_btn, "idle")
     
     def _on_download_btn_hover(self, entered: bool) -> None:
         """Handle hover on download button to show uninstall option."""
@@ -652,37 +731,21 @@ class SettingsPage(QWidget):
         self._downloading_model = True
         self._download_btn.setText("⏳ 0%")
         self._download_btn.setEnabled(False)
-        self._download_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {Colors.WARNING};
-                color: {Colors.BG_DARK};
-                border: none;
-                border-radius: 6px;
-                padding: 8px 12px;
-                font-size: 12px;
-            }}
-        """)
+        set_style_state(self._download_btn, "downloading")
         self._download_progress.setValue(0)
         self._download_progress.show()
         self._progress_label.setText("Préparation...")
         self._progress_label.show()
         self._model_status.setText("Téléchargement en cours...")
-        self._model_status.setStyleSheet(f"color: {Colors.WARNING};")
+        set_style_state(self._model_status, "warning")
         
         def download():
             try:
                 from faster_whisper import WhisperModel
+                from src.core.whisper_transcriber import WhisperTranscriber
                 
                 # Detect device
-                device = "cpu"
-                compute_type = "int8"
-                try:
-                    import ctranslate2
-                    if "cuda" in ctranslate2.get_supported_compute_types("cuda"):
-                        device = "cuda"
-                        compute_type = "float16"
-                except Exception:
-                    pass
+                device, compute_type = WhisperTranscriber.select_device()
                 
                 # Download and load model - this will show progress in console
                 # We'll use a timer to poll for file existence
@@ -719,7 +782,6 @@ class SettingsPage(QWidget):
     def _on_download_complete(self, success: bool, error: str = "") -> None:
         """Handle download completion (called from thread)."""
         # Use signal to update UI in main thread
-        from PyQt6.QtCore import QTimer
         if success:
             QTimer.singleShot(0, self._on_download_success)
         else:
@@ -739,10 +801,10 @@ class SettingsPage(QWidget):
         self._progress_label.hide()
         self._download_btn.setText("📥 Télécharger")
         self._download_btn.setEnabled(True)
-        self._download_btn.setStyleSheet(self._get_button_style())
+        set_style_state(self._download_btn, "idle")
         error_msg = error[:40] + "..." if len(error) > 40 else error
         self._model_status.setText(f"❌ Erreur: {error_msg}")
-        self._model_status.setStyleSheet(f"color: {Colors.ERROR};")
+        set_style_state(self._model_status, "error")
     
     def _uninstall_model(self, model_id: str) -> None:
         """Uninstall (delete) a downloaded model."""
@@ -754,42 +816,50 @@ class SettingsPage(QWidget):
             if model_path.exists():
                 shutil.rmtree(model_path)
                 self._model_status.setText("🗑️ Modèle désinstallé")
-                self._model_status.setStyleSheet(f"color: {Colors.TEXT_MUTED};")
+                set_style_state(self._model_status, "idle")
             
             # Update status after short delay
             QTimer.singleShot(500, self._update_model_status)
             
         except Exception as e:
             self._model_status.setText(f"❌ Erreur: {str(e)[:30]}...")
-            self._model_status.setStyleSheet(f"color: {Colors.ERROR};")
+            set_style_state(self._model_status, "error")
     
     def _on_auto_paste_changed(self, state: int) -> None:
         is_checked = state == Qt.CheckState.Checked.value
         settings.set("auto_paste", is_checked)
         self._update_checkbox_style(self._auto_paste_check, is_checked)
+        self.settings_changed.emit()
     
     def _on_sound_changed(self, state: int) -> None:
         is_checked = state == Qt.CheckState.Checked.value
         settings.set("sound_enabled", is_checked)
         self._update_checkbox_style(self._sound_check, is_checked)
+        self.settings_changed.emit()
 
+    def _on_parallel_changed(self, state: int) -> None:
+        is_checked = state == Qt.CheckState.Checked.value
+        settings.set("parallel_transcribe", is_checked)
+        self._update_checkbox_style(self._parallel_check, is_checked)
+        self.settings_changed.emit()
+    
     def _on_silence_changed(self, state: int) -> None:
         is_checked = state == Qt.CheckState.Checked.value
         settings.set("silence_detection_enabled", is_checked)
         self._update_checkbox_style(self._silence_check, is_checked)
         self._silence_options.setVisible(is_checked)
+        self.settings_changed.emit()
 
     def _on_silence_slider_changed(self, value: int) -> None:
         settings.set("silence_threshold_seconds", value)
         self._silence_label.setText(f"Durée: {value} secondes")
+        self.settings_changed.emit()
     
     def _update_checkbox_style(self, checkbox: QCheckBox, checked: bool) -> None:
         """Update checkbox style based on state."""
-        if checked:
-            checkbox.setStyleSheet(self._get_checkbox_style_on())
-        else:
-            checkbox.setStyleSheet(self._get_checkbox_style_off())
+        set_style_state(checkbox, "on" if checked else "off")
     
     def refresh(self) -> None:
-        """Refresh settings display."""
-        self._load_current_settings()
+        """Refresh settings display (the first show loads them anyway)."""
+        if self._built:
+            self._load_current_settings()
@@ -1,6 +1,6 @@
 """
 V2T 2.1 - UI Styles Package
 """
-from .theme import get_main_stylesheet, get_mic_button_style, get_card_style
+from .theme import get_main_stylesheet, get_mic_button_style, get_card_style, set_style_state
 
-__all__ = ["get_main_stylesheet", "get_mic_button_style", "get_card_style"]
+__all__ = ["get_main_stylesheet", "get_mic_button_style", "get_card_style", "set_style_state"]
@@ -290,3 +290,17 @@ def get_card_style(is_selected: bool = False) -> str:
             border-color: {Colors.ACCENT_PRIMARY};
         }}
     """
+
+
+def set_style_state(widget, state: str) -> None:
+    """
+    Switch a widget's "state" dynamic property and re-polish it, so
+    [state="..."] selectors in an installed stylesheet apply without
+    parsing a new one.
+    """
+    if widget.property("state") == state:
+        return
+    widget.setProperty("state", state)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
@@ -2,6 +2,7 @@
 V2T 2.1 - Animated Microphone Button
 Large circular button with glow effect and animations.
 """
+import math
 from typing import Optional
 
 from PyQt6.QtWidgets import QWidget, QPushButton
@@ -11,7 +12,7 @@ from PyQt6.QtCore import (
 )
 from PyQt6.QtGui import (
     QPainter, QColor, QPen, QRadialGradient,
-    QBrush, QPainterPath, QFont
+    QBrush, QPainterPath, QFont, QPixmap
 )
 
 from src.utils.constants import Colors, UIConfig
@@ -33,6 +34,7 @@ class MicButton(QWidget):
         self._is_recording = False
         self._glow_intensity = 0.0
         self._pulse_phase = 0.0
+        self._painted_glow_alpha = -1  # Glow alpha of the last paint
         self._hover = False
         
         # Size
@@ -44,6 +46,9 @@ class MicButton(QWidget):
         self._color_recording = QColor(Colors.ERROR)
         self._color_glow = QColor(Colors.ACCENT_GLOW)
         
+        # Pre-rendered ring + circle + icon, keyed by (recording, device pixel ratio)
+        self._body_cache: dict = {}
+        
         # Animation
         self._pulse_timer = QTimer(self)
         self._pulse_timer.timeout.connect(self._update_pulse)
@@ -85,7 +90,15 @@ class MicButton(QWidget):
         self._pulse_phase += 0.05
         if self._pulse_phase > 2 * 3.14159:
             self._pulse_phase = 0
-        self.update()
+        
+        # Most ticks move the glow by less than one alpha step: skip those repaints
+        if self._glow_alpha() != self._painted_glow_alpha:
+            self.update()
+    
+    def _glow_alpha(self) -> int:
+        """Glow opacity for the current pulse phase and hover intensity."""
+        pulse = 0.5 + 0.5 * math.sin(self._pulse_phase)
+        return int(100 * (self._glow_intensity + pulse * 0.3))
     
     def mousePressEvent(self, event) -> None:
         """Handle mouse press."""
@@ -117,10 +130,6 @@ class MicButton(QWidget):
         center_x = self.width() / 2
         center_y = self.height() / 2
         
-        # Calculate pulse
-        import math
-        pulse = 0.5 + 0.5 * math.sin(self._pulse_phase)
-        
         # Current color
         if self._is_recording:
             main_color = self._color_recording
@@ -129,7 +138,8 @@ class MicButton(QWidget):
         
         # Draw glow
         glow_radius = self._size / 2 + 20
-        glow_alpha = int(100 * (self._glow_intensity + pulse * 0.3))
+        glow_alpha = self._glow_alpha()
+        self._painted_glow_alpha = glow_alpha
         
         glow_gradient = QRadialGradient(center_x, center_y, glow_radius)
         glow_color = QColor(main_color)
@@ -146,6 +156,33 @@ class MicButton(QWidget):
             int(glow_radius * 2)
         )
         
+        # Static part of the button only changes with the recording state
+        painter.drawPixmap(0, 0, self._get_body_pixmap())
+    
+    def _get_body_pixmap(self) -> QPixmap:
+        """Return the cached button body for the current state."""
+        ratio = self.devicePixelRatioF()
+        key = (self._is_recording, ratio)
+        pixmap = self._body_cache.get(key)
+        if pixmap is None:
+            pixmap = QPixmap(int(self.width() * ratio), int(self.height() * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            self._draw_body(painter)
+            painter.end()
+            
+            self._body_cache[key] = pixmap
+        return pixmap
+    
+    def _draw_body(self, painter: QPainter) -> None:
+        """Draw the ring, main circle and microphone icon."""
+        center_x = self.width() / 2
+        center_y = self.height() / 2
+        main_color = self._color_recording if self._is_recording else self._color_idle
+        
         # Draw outer ring
         ring_radius = self._size / 2 + 5
         painter.setPen(QPen(main_color, 3))
@@ -232,3 +269,8 @@ class MicButton(QWidget):
         """Stop animations."""
         self._pulse_timer.stop()
         self._glow_anim.stop()
+    
+    def start(self) -> None:
+        """Start the pulse animation."""
+        if not self._pulse_timer.isActive():
+            self._pulse_timer.start(30)
@@ -9,12 +9,68 @@ from PyQt6.QtWidgets import (
     QFrame, QVBoxLayout, QHBoxLayout, 
     QLabel, QPushButton, QWidget
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QFont, QCursor
 
 from src.utils.constants import Colors
 
 
+# Installed once on the history list container so cards don't each parse a sheet
+CARD_STYLESHEET = f"""
+    QFrame#TranscriptCard {{
+        background-color: {Colors.BG_CARD};
+        border: 1px solid {Colors.BORDER_DEFAULT};
+        border-radius: 16px;
+    }}
+    QFrame#TranscriptCard:hover {{
+        border-color: {Colors.ACCENT_PRIMARY};
+    }}
+    QLabel#TranscriptCardTitle {{
+        color: {Colors.TEXT_PRIMARY};
+    }}
+    QLabel#TranscriptCardInfo {{
+        color: {Colors.TEXT_MUTED};
+    }}
+    QLabel#TranscriptCardPreview {{
+        color: {Colors.TEXT_SECONDARY};
+    }}
+    QPushButton#TranscriptCardCorrect {{
+        background-color: transparent;
+        color: {Colors.ACCENT_SECONDARY};
+        border: 1px solid {Colors.ACCENT_SECONDARY};
+        border-radius: 6px;
+        padding: 6px 12px;
+    }}
+    QPushButton#TranscriptCardCorrect:hover {{
+        background-color: {Colors.ACCENT_SECONDARY};
+        color: {Colors.BG_DARK};
+    }}
+    QPushButton#TranscriptCardCopy {{
+        background-color: transparent;
+        color: {Colors.ACCENT_PRIMARY};
+        border: 1px solid {Colors.ACCENT_PRIMARY};
+        border-radius: 6px;
+        padding: 6px 12px;
+    }}
+    QPushButton#TranscriptCardCopy:hover {{
+        background-color: {Colors.ACCENT_PRIMARY};
+        color: {Colors.BG_DARK};
+    }}
+    QPushButton#TranscriptCardDelete {{
+        background-color: transparent;
+        color: {Colors.TEXT_MUTED};
+        border: 1px solid {Colors.BORDER_DEFAULT};
+        border-radius: 6px;
+        padding: 6px 10px;
+    }}
+    QPushButton#TranscriptCardDelete:hover {{
+        background-color: {Colors.ERROR};
+        border-color: {Colors.ERROR};
+        color: white;
+    }}
+"""
+
+
 class TranscriptCard(QFrame):
     """
     Card widget for displaying a transcript in the history.
@@ -24,6 +80,8 @@ class TranscriptCard(QFrame):
     - Correct grammar button
     - Delete button
     - Hover animations
+    
+    Styling comes from CARD_STYLESHEET on the parent container.
     """
     
     # Signals
@@ -46,11 +104,13 @@ class TranscriptCard(QFrame):
         self._id = transcript_id
         self._title = title
         self._text = text
+        self._search_blob = f"{title}\n{text}".casefold()  # Precomputed for filtering
         self._created_at = created_at
         self._duration = duration
         
+        self.setObjectName("TranscriptCard")
+        self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self._setup_ui()
-        self._setup_style()
     
     def _setup_ui(self) -> None:
         """Setup the card layout."""
@@ -65,30 +125,22 @@ class TranscriptCard(QFrame):
         # Title
         self._title_label = QLabel(self._title)
         self._title_label.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
-        self._title_label.setStyleSheet(f"color: {Colors.TEXT_PRIMARY};")
+        self._title_label.setObjectName("TranscriptCardTitle")
         header.addWidget(self._title_label, 1)
         
         # Date and duration
-        date_str = self._created_at.strftime("%d/%m/%Y")
-        duration_str = self._format_duration(self._duration)
-        
-        info_text = f"{date_str}\n{duration_str}"
-        self._info_label = QLabel(info_text)
+        self._info_label = QLabel(self._info_text())
         self._info_label.setFont(QFont("Segoe UI", 9))
-        self._info_label.setStyleSheet(f"color: {Colors.TEXT_MUTED};")
+        self._info_label.setObjectName("TranscriptCardInfo")
         self._info_label.setAlignment(Qt.AlignmentFlag.AlignRight)
         header.addWidget(self._info_label)
         
         layout.addLayout(header)
         
         # Preview text
-        preview = self._text[:150].replace("\n", " ")
-        if len(self._text) > 150:
-            preview += "..."
-        
-        self._preview_label = QLabel(preview)
+        self._preview_label = QLabel(self._preview_text())
         self._preview_label.setFont(QFont("Segoe UI", 10))
-        self._preview_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY};")
+        self._preview_label.setObjectName("TranscriptCardPreview")
         self._preview_label.setWordWrap(True)
         layout.addWidget(self._preview_label)
         
@@ -102,19 +154,7 @@ class TranscriptCard(QFrame):
         self._correct_btn.setFont(QFont("Segoe UI", 9))
         self._correct_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self._correct_btn.clicked.connect(self._on_correct)
-        self._correct_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {Colors.ACCENT_SECONDARY};
-                border: 1px solid {Colors.ACCENT_SECONDARY};
-                border-radius: 6px;
-                padding: 6px 12px;
-            }}
-            QPushButton:hover {{
-                background-color: {Colors.ACCENT_SECONDARY};
-                color: {Colors.BG_DARK};
-            }}
-        """)
+        self._correct_btn.setObjectName("TranscriptCardCorrect")
         buttons_layout.addWidget(self._correct_btn)
 
         # Copy button
@@ -122,19 +162,7 @@ class TranscriptCard(QFrame):
         self._copy_btn.setFont(QFont("Segoe UI", 9))
         self._copy_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self._copy_btn.clicked.connect(self._on_copy)
-        self._copy_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {Colors.ACCENT_PRIMARY};
-                border: 1px solid {Colors.ACCENT_PRIMARY};
-                border-radius: 6px;
-                padding: 6px 12px;
-            }}
-            QPushButton:hover {{
-                background-color: {Colors.ACCENT_PRIMARY};
-                color: {Colors.BG_DARK};
-            }}
-        """)
+        self._copy_btn.setObjectName("TranscriptCardCopy")
         buttons_layout.addWidget(self._copy_btn)
         
         # Delete button
@@ -142,37 +170,22 @@ class TranscriptCard(QFrame):
         self._delete_btn.setFont(QFont("Segoe UI", 9))
         self._delete_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self._delete_btn.clicked.connect(self._on_delete)
-        self._delete_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {Colors.TEXT_MUTED};
-                border: 1px solid {Colors.BORDER_DEFAULT};
-                border-radius: 6px;
-                padding: 6px 10px;
-            }}
-            QPushButton:hover {{
-                background-color: {Colors.ERROR};
-                border-color: {Colors.ERROR};
-                color: white;
-            }}
-        """)
+        self._delete_btn.setObjectName("TranscriptCardDelete")
         buttons_layout.addWidget(self._delete_btn)
         
         layout.addLayout(buttons_layout)
     
-    def _setup_style(self) -> None:
-        """Setup card styling."""
-        self.setStyleSheet(f"""
-            TranscriptCard {{
-                background-color: {Colors.BG_CARD};
-                border: 1px solid {Colors.BORDER_DEFAULT};
-                border-radius: 16px;
-            }}
-            TranscriptCard:hover {{
-                border-color: {Colors.ACCENT_PRIMARY};
-            }}
-        """)
-        self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+    def _info_text(self) -> str:
+        """Date and duration shown in the header."""
+        date_str = self._created_at.strftime("%d/%m/%Y")
+        return f"{date_str}\n{self._format_duration(self._duration)}"
+    
+    def _preview_text(self) -> str:
+        """First 150 characters of the text, on one line."""
+        preview = self._text[:150].replace("\n", " ")
+        if len(self._text) > 150:
+            preview += "..."
+        return preview
     
     def _format_duration(self, seconds: float) -> str:
         """Format duration to MM:SS."""
@@ -197,7 +210,6 @@ class TranscriptCard(QFrame):
         # Animate button
         self._correct_btn.setText("✨ Correction...")
         self._correct_btn.setEnabled(False)
-        from PyQt6.QtCore import QTimer
         QTimer.singleShot(3000, self._reset_correct_button)
     
     def _reset_correct_button(self) -> None:
@@ -221,7 +233,34 @@ class TranscriptCard(QFrame):
     def text(self) -> str:
         return self._text
     
+    @property
+    def search_blob(self) -> str:
+        """Casefolded title and text, matched by the history filter."""
+        return self._search_blob
+    
     def update_title(self, new_title: str) -> None:
         """Update the displayed title."""
         self._title = new_title
+        self._search_blob = f"{new_title}\n{self._text}".casefold()
         self._title_label.setText(new_title)
+    
+    def update_content(
+        self,
+        transcript_id: int,
+        title: str,
+        text: str,
+        created_at: datetime,
+        duration: float = 0.0
+    ) -> None:
+        """Show another transcript in this card (used when recycling cards)."""
+        self._id = transcript_id
+        self._title = title
+        self._text = text
+        self._search_blob = f"{title}\n{text}".casefold()
+        self._created_at = created_at
+        self._duration = duration
+        
+        self._title_label.setText(title)
+        self._info_label.setText(self._info_text())
+        self._preview_label.setText(self._preview_text())
+        self._reset_correct_button()
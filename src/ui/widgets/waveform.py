@@ -26,6 +26,9 @@ class WaveformWidget(QWidget):
         self._bar_heights: List[float] = [0.0] * self._num_bars
         self._target_heights: List[float] = [0.0] * self._num_bars
         
+        # Precomputed bar envelope for the RMS fallback
+        self._wave_shape = np.sin(np.arange(self._num_bars) / self._num_bars * np.pi)
+        
         # Animation
         self._smoothing = 0.3  # Interpolation factor
         self._decay = 0.95  # How fast bars decay
@@ -78,28 +81,22 @@ class WaveformWidget(QWidget):
             
             # Downsample to number of bars
             if len(fft_data) > self._num_bars:
-                # Average bins for each bar
+                # Average bins for each bar (one vectorized reduction)
                 bin_size = len(fft_data) // self._num_bars
-                bars = []
-                for i in range(self._num_bars):
-                    start = i * bin_size
-                    end = start + bin_size
-                    bar_value = np.mean(fft_data[start:end])
-                    bars.append(bar_value)
-                self._target_heights = bars
+                bins = fft_data[:bin_size * self._num_bars].reshape(self._num_bars, bin_size)
+                self._target_heights = bins.mean(axis=1).tolist()
             else:
                 # Pad if needed
                 self._target_heights = list(fft_data) + [0.0] * (self._num_bars - len(fft_data))
-            
+        
         except Exception:
             # Fallback: use RMS for simple volume bars
-            rms = np.sqrt(np.mean(audio_data.astype(np.float32) ** 2))
+            samples = audio_data.ravel()
+            rms = np.sqrt(np.einsum("i,i->", samples, samples, dtype=np.float64) / samples.size)
             normalized = min(rms / 5000, 1.0)
             
             # Create wave pattern
-            for i in range(self._num_bars):
-                factor = np.sin(i / self._num_bars * np.pi)
-                self._target_heights[i] = normalized * factor
+            self._target_heights = (normalized * self._wave_shape).tolist()
     
     def set_idle(self) -> None:
         """Set waveform to idle state with subtle animation."""
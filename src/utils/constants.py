@@ -21,6 +21,10 @@ CONFIG_FILE = DATA_DIR / "settings.json"
 DATABASE_FILE = DATA_DIR / "transcripts.db"
 ICON_FILE = DATA_DIR / "icon.ico"
 SOUND_FILE = SOUNDS_DIR / "pop.wav"
+BEEP_FILE = SOUNDS_DIR / "beep.wav"  # Generated when SOUND_FILE is missing
+
+# Delay used to coalesce bursts of settings writes (seconds)
+SETTINGS_SAVE_DELAY = 0.2
 
 # ===========================================
 # COLORS - Purple/Dark Theme
@@ -61,6 +65,15 @@ class AudioConfig:
     CHANNELS = 1         # Mono
     CHUNK_SIZE = 1024
     DTYPE = "int16"
+    SAMPLE_WIDTH = 2     # Bytes per sample (int16)
+    INITIAL_BUFFER_SECONDS = 30  # Preallocated recording buffer, grows as needed
+    DEVICE_CACHE_SECONDS = 5.0   # How long the input device list is reused
+    MAX_RECORD_SECONDS = 600     # Older audio is dropped past this (Groq upload limit is 25 MB)
+    MIN_SPEECH_RMS = 250         # Loudest block must reach this int16 RMS to be transcribed
+    SILENCE_PEAK_HALF_LIFE = 5.0  # Seconds for the tracked speech peak to halve
+    SILENCE_FLOOR_AMP = 0.005     # Silence threshold never drops below this (0.0 - 1.0)
+    TRIM_FRAME = 256             # Samples per frame when trimming leading/trailing silence
+    TRIM_MARGIN_SECONDS = 0.2    # Audio kept around the detected speech
 
 # ===========================================
 # UI SETTINGS
@@ -78,6 +91,14 @@ class UIConfig:
     # Waveform
     WAVEFORM_BARS = 64
     WAVEFORM_HEIGHT = 80
+    WAVEFORM_REFRESH_MS = 33  # Audio blocks are coalesced to at most ~30 updates/s
+    
+    # History search
+    SEARCH_DEBOUNCE_MS = 150
+    
+    # History list: cards are mounted in batches as the user scrolls
+    HISTORY_BATCH_SIZE = 20
+    HISTORY_PREFETCH_PX = 300  # Mount the next batch this close to the bottom
 
 # ===========================================
 # TRANSCRIPTION SETTINGS
@@ -86,6 +107,12 @@ class TranscriptionConfig:
     # Whisper model for offline
     WHISPER_MODEL = "base"  # tiny, base, small, medium, large-v3
     
+    # Local decoding: greedy search is several times faster than beam
+    # search on short single-speaker notes, for a marginal accuracy cost
+    BEAM_SIZE = 1
+    TEMPERATURE = 0.0
+    VAD_MIN_SILENCE_MS = 500
+    
     # Supported languages
     LANGUAGES = {
         "Français": "fr",
@@ -109,6 +136,7 @@ DEFAULT_SETTINGS = {
     "language": "fr",
     "hotkey": "F8",
     "use_online": True,      # True = Groq, False = Offline Whisper
+    "parallel_transcribe": False,  # Also run the loaded local model, first result wins
     "auto_paste": True,
     "sound_enabled": True,
     "silence_detection_enabled": False,